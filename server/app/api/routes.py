@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from functools import lru_cache
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
 from urllib.parse import urlparse
 
 import httpx
-from fastapi import APIRouter, File, Query, Request, UploadFile
+import orjson
+from fastapi import APIRouter, File, Query, Request, Response, UploadFile
+from pydantic import BaseModel
 
 from app.core.config import clear_settings_cache, get_settings
 from app.core.errors import AppError, ErrorCode
-from app.core.response import success_response
+from app.core.request_context import get_request_id
+from app.core.response import (
+    ORJSONResponse,
+    error_response,
+    success_body,
+    success_response,
+)
 from app.models.schemas import (
     AsyncJobCreateData,
     AsyncJobListData,
@@ -55,7 +67,7 @@ from app.models.schemas import (
     XiaohongshuSyncedNotesPruneData,
 )
 from app.services.bilibili import BilibiliSummarizer
-from app.services.async_jobs import AsyncJobService
+from app.services.async_jobs import AsyncJobService, job_not_found_message
 from app.services.asset_image_fill import AssetImageFillService
 from app.services.asset_snapshots import AssetSnapshotService
 from app.services.editable_config import EditableConfigService
@@ -64,58 +76,156 @@ from app.services.note_library import NoteLibraryService
 from app.services.xiaohongshu import XiaohongshuService
 from tools import xhs_capture_to_config as xhs_capture_tool
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+_ServiceT = TypeVar("_ServiceT")
+
+# Constant payloads are serialized once; only per-request values are spliced in.
+_REQUEST_ID_PLACEHOLDER = b'"__REQUEST_ID__"'
+_JOB_ID_PLACEHOLDER = b"__JOB_ID__"
+_HEALTH_BODY_PREFIX, _HEALTH_BODY_SUFFIX = orjson.dumps(
+    success_response(
+        data=HealthData().model_dump(),
+        request_id=_REQUEST_ID_PLACEHOLDER.strip(b'"').decode(),
+    )
+).split(_REQUEST_ID_PLACEHOLDER)
+_JOB_NOT_FOUND_BODY_TEMPLATE = orjson.dumps(
+    error_response(
+        code=ErrorCode.JOB_NOT_FOUND,
+        message=job_not_found_message(_JOB_ID_PLACEHOLDER.decode()),
+        request_id=_REQUEST_ID_PLACEHOLDER.strip(b'"').decode(),
+    )
+)
+
+
+@dataclass
+class _RuntimeServices:
+    summarizer: BilibiliSummarizer | None = None
+    xiaohongshu: XiaohongshuService | None = None
+    note_library: NoteLibraryService | None = None
+    editable_config: EditableConfigService | None = None
+    finance_signals: FinanceSignalsService | None = None
+    asset_image_fill: AssetImageFillService | None = None
+    asset_snapshot: AssetSnapshotService | None = None
+    xiaohongshu_probe_url: str | None = None
+
+
+_services = _RuntimeServices()
+_services_lock = threading.Lock()
+# Held across each .env/config write and the reload that follows it. The writes run in
+# worker threads, so concurrent auth or config updates would otherwise interleave.
+_config_reload_lock = asyncio.Lock()
+
+
+def _init_service(name: str, factory: Callable[[], _ServiceT]) -> _ServiceT:
+    with _services_lock:
+        service = getattr(_services, name)
+        if service is None:
+            service = factory()
+            setattr(_services, name, service)
+        return service
+
 
-@lru_cache(maxsize=1)
 def _get_summarizer() -> BilibiliSummarizer:
-    settings = get_settings()
-    return BilibiliSummarizer(settings)
+    service = _services.summarizer
+    if service is None:
+        service = _init_service("summarizer", lambda: BilibiliSummarizer(get_settings()))
+    return service
 
 
-@lru_cache(maxsize=1)
 def _get_xiaohongshu_service() -> XiaohongshuService:
-    settings = get_settings()
-    return XiaohongshuService(settings)
+    service = _services.xiaohongshu
+    if service is None:
+        service = _init_service("xiaohongshu", lambda: XiaohongshuService(get_settings()))
+    return service
+
 
-@lru_cache(maxsize=1)
 def _get_note_library_service() -> NoteLibraryService:
-    settings = get_settings()
-    return NoteLibraryService(settings)
+    service = _services.note_library
+    if service is None:
+        service = _init_service("note_library", lambda: NoteLibraryService(get_settings()))
+    return service
 
 
-@lru_cache(maxsize=1)
 def _get_editable_config_service() -> EditableConfigService:
-    return EditableConfigService()
+    service = _services.editable_config
+    if service is None:
+        service = _init_service("editable_config", EditableConfigService)
+    return service
 
 
-@lru_cache(maxsize=1)
 def _get_finance_signals_service() -> FinanceSignalsService:
-    return FinanceSignalsService(get_settings())
+    service = _services.finance_signals
+    if service is None:
+        service = _init_service(
+            "finance_signals", lambda: FinanceSignalsService(get_settings())
+        )
+    return service
 
 
-@lru_cache(maxsize=1)
 def _get_asset_image_fill_service() -> AssetImageFillService:
-    settings = get_settings()
-    return AssetImageFillService(settings)
+    service = _services.asset_image_fill
+    if service is None:
+        service = _init_service(
+            "asset_image_fill", lambda: AssetImageFillService(get_settings())
+        )
+    return service
 
 
-@lru_cache(maxsize=1)
 def _get_asset_snapshot_service() -> AssetSnapshotService:
-    settings = get_settings()
-    return AssetSnapshotService(settings)
+    service = _services.asset_snapshot
+    if service is None:
+        service = _init_service(
+            "asset_snapshot", lambda: AssetSnapshotService(get_settings())
+        )
+    return service
+
+
+def _get_xiaohongshu_probe_url() -> str:
+    url = _services.xiaohongshu_probe_url
+    if url is None:
+        url = _init_service("xiaohongshu_probe_url", _resolve_xiaohongshu_probe_url)
+    return url
+
+
+def _resolve_xiaohongshu_probe_url() -> str:
+    request_url = get_settings().xiaohongshu.web_readonly.request_url.strip()
+    if not request_url:
+        return ""
+    host = urlparse(request_url).netloc.strip().lower()
+    if not host:
+        return ""
+    return f"https://{host}/api/sns/web/v2/user/me"
 
 
 def _reload_runtime_services() -> None:
-    clear_settings_cache()
-    _get_summarizer.cache_clear()
-    _get_xiaohongshu_service.cache_clear()
-    _get_note_library_service.cache_clear()
-    _get_editable_config_service.cache_clear()
-    _get_finance_signals_service.cache_clear()
-    _get_asset_image_fill_service.cache_clear()
-    _get_asset_snapshot_service.cache_clear()
+    global _services
+    with _services_lock:
+        clear_settings_cache()
+        _services = _RuntimeServices()
+
+
+def _success_response(data: BaseModel) -> Response:
+    return Response(
+        content=success_body(data, get_request_id()),
+        media_type="application/json",
+    )
+
+
+def _apply_env_updates_and_reload(updates: dict[str, str]) -> None:
+    # Callers hold _config_reload_lock so the .env file, os.environ and the reloaded
+    # services stay in step.
+    os.environ.update({key: value for key, value in updates.items() if value})
+    _reload_runtime_services()
+
+
+def _job_not_found_response(job_id: str, request_id: str) -> Response:
+    # Status polls often outlive their job, so skip the AppError round trip here.
+    body = _JOB_NOT_FOUND_BODY_TEMPLATE.replace(
+        _JOB_ID_PLACEHOLDER, orjson.dumps(job_id)[1:-1]
+    ).replace(_REQUEST_ID_PLACEHOLDER, orjson.dumps(request_id))
+    return Response(content=body, status_code=404, media_type="application/json")
 
 
 def _get_async_job_service(request: Request) -> AsyncJobService:
@@ -130,12 +240,10 @@ def _get_async_job_service(request: Request) -> AsyncJobService:
 
 
 def _count_cookie_pairs(raw_cookie: str) -> int:
-    pairs = 0
-    for segment in raw_cookie.split(";"):
-        token = segment.strip()
-        if token and "=" in token:
-            pairs += 1
-    return pairs
+    # A segment holding "=" is never blank, so no per-segment strip is needed.
+    if "=" not in raw_cookie:
+        return 0
+    return sum("=" in segment for segment in raw_cookie.split(";"))
 
 
 def _coerce_bool(value: object) -> bool | None:
@@ -154,34 +262,28 @@ def _coerce_bool(value: object) -> bool | None:
 
 async def _probe_xiaohongshu_web_identity(
     *,
+    client: httpx.AsyncClient | None,
     cookie: str,
     user_agent: str,
     origin: str,
     referer: str,
 ) -> tuple[str, bool] | None:
-    settings = get_settings()
-    request_url = settings.xiaohongshu.web_readonly.request_url.strip()
-    if not request_url:
+    url = _get_xiaohongshu_probe_url()
+    if not url or client is None:
         return None
 
-    host = urlparse(request_url).netloc.strip().lower()
-    if not host:
-        return None
-
-    headers: dict[str, str] = {
-        "Cookie": cookie,
-        "User-Agent": user_agent,
-        "Accept": "application/json, text/plain, */*",
-    }
+    headers: list[tuple[str, str]] = [
+        ("Cookie", cookie),
+        ("User-Agent", user_agent),
+        ("Accept", "application/json, text/plain, */*"),
+    ]
     if origin:
-        headers["Origin"] = origin
+        headers.append(("Origin", origin))
     if referer:
-        headers["Referer"] = referer
+        headers.append(("Referer", referer))
 
-    url = f"https://{host}/api/sns/web/v2/user/me"
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, headers=headers)
+        response = await client.get(url, headers=headers)
     except httpx.HTTPError:
         return None
 
@@ -191,8 +293,8 @@ async def _probe_xiaohongshu_web_identity(
         return None
 
     try:
-        payload = response.json()
-    except ValueError:
+        payload = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         return None
     if not isinstance(payload, dict):
         return None
@@ -218,141 +320,139 @@ async def run_xiaohongshu_summary_job(url: str):
 
 
 @router.get("/health")
-async def health(request: Request) -> dict:
-    data = HealthData().model_dump()
-    return success_response(data=data, request_id=request.state.request_id)
+async def health() -> Response:
+    body = _HEALTH_BODY_PREFIX + orjson.dumps(get_request_id()) + _HEALTH_BODY_SUFFIX
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/api/finance/signals")
-async def get_finance_signals(request: Request) -> dict:
+async def get_finance_signals() -> Response:
     service = _get_finance_signals_service()
     data = service.get_dashboard_state()
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.put("/api/finance/signals/watchlist-ntfy")
 async def update_finance_watchlist_ntfy(
-    payload: FinanceWatchlistNtfyUpdateRequest, request: Request
-) -> dict:
+    payload: FinanceWatchlistNtfyUpdateRequest,
+) -> Response:
     service = _get_finance_signals_service()
     enabled = service.set_watchlist_ntfy_enabled(payload.enabled)
-    data = FinanceWatchlistNtfyData(enabled=enabled)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = FinanceWatchlistNtfyData.model_construct(enabled=enabled)
+    return _success_response(data)
 
 
 @router.post("/api/finance/signals/digest")
-async def trigger_finance_news_digest(request: Request) -> dict:
+async def trigger_finance_news_digest() -> Response:
     service = _get_finance_signals_service()
     data = await service.trigger_news_digest()
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/finance/signals/cards/{card_id}/status")
 async def update_finance_focus_card_status(
     card_id: str,
     payload: FinanceFocusCardActionRequest,
-    request: Request,
-) -> dict:
+) -> Response:
     service = _get_finance_signals_service()
     data: FinanceFocusCardActionData = service.update_focus_card_status(
         card_id=card_id,
         status=payload.status,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.get("/api/finance/signals/history")
 async def get_finance_focus_card_history(
-    request: Request,
     limit: int = Query(default=50, ge=1, le=200),
-) -> dict:
+) -> Response:
     service = _get_finance_signals_service()
     data: FinanceFocusCardHistoryData = service.get_focus_card_history(limit=limit)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/assets/fill-from-images")
 async def fill_asset_stats_from_images(
-    request: Request,
     images: list[UploadFile] = File(...),
-) -> dict:
+) -> Response:
     service = _get_asset_image_fill_service()
     result: AssetImageFillData = await service.extract_from_uploads(images)
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.get("/api/assets/current")
-async def get_asset_current(request: Request) -> dict:
+async def get_asset_current() -> Response:
     service = _get_asset_snapshot_service()
     data: AssetCurrentData = service.get_current()
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.put("/api/assets/current")
 async def update_asset_current(
     payload: AssetCurrentUpdateRequest,
-    request: Request,
-) -> dict:
+) -> Response:
     service = _get_asset_snapshot_service()
-    data: AssetCurrentData = service.update_current(
+    # Asset writes end with a full database backup; run them off the event loop.
+    data: AssetCurrentData = await asyncio.to_thread(
+        service.update_current,
         total_amount_wan=payload.total_amount_wan,
         amounts=payload.amounts,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.get("/api/assets/snapshots")
-async def list_asset_snapshot_history(request: Request) -> dict:
+async def list_asset_snapshot_history() -> Response:
     service = _get_asset_snapshot_service()
     data: AssetSnapshotHistoryData = service.list_history()
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/assets/snapshots")
 async def save_asset_snapshot(
     payload: AssetSnapshotSaveRequest,
-    request: Request,
-) -> dict:
+) -> Response:
     service = _get_asset_snapshot_service()
-    data: AssetSnapshotRecord = service.save_snapshot(
+    data: AssetSnapshotRecord = await asyncio.to_thread(
+        service.save_snapshot,
         record_id=payload.id,
         saved_at=payload.saved_at,
         total_amount_wan=payload.total_amount_wan,
         amounts=payload.amounts,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.delete("/api/assets/snapshots/{record_id}")
-async def delete_asset_snapshot(record_id: str, request: Request) -> dict:
+async def delete_asset_snapshot(record_id: str) -> Response:
     service = _get_asset_snapshot_service()
-    deleted_count = service.delete_snapshot(record_id)
-    data = NotesDeleteData(deleted_count=deleted_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    deleted_count = await asyncio.to_thread(service.delete_snapshot, record_id)
+    data = NotesDeleteData.model_construct(deleted_count=deleted_count)
+    return _success_response(data)
 
 
 @router.post("/api/jobs/bilibili-summarize")
 async def create_bilibili_summarize_job(
     payload: BilibiliSummaryRequest, request: Request
-) -> dict:
+) -> Response:
     service = _get_async_job_service(request)
     data: AsyncJobCreateData = await service.create_bilibili_summary_job(
         video_url=payload.video_url,
-        request_id=request.state.request_id,
+        request_id=get_request_id(),
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/jobs/xiaohongshu/summarize-url")
 async def create_xiaohongshu_summarize_job(
     payload: XiaohongshuUrlSummaryRequest, request: Request
-) -> dict:
+) -> Response:
     service = _get_async_job_service(request)
     data: AsyncJobCreateData = await service.create_xiaohongshu_summary_job(
         url=payload.url,
-        request_id=request.state.request_id,
+        request_id=get_request_id(),
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.get("/api/jobs")
@@ -361,64 +461,70 @@ async def list_async_jobs(
     limit: int = Query(default=20, ge=1, le=100),
     status: str = Query(default=""),
     job_type: str = Query(default=""),
-) -> dict:
+) -> Response:
     service = _get_async_job_service(request)
     data: AsyncJobListData = await service.list_jobs(
         limit=limit,
         status=status,
         job_type=job_type,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.get("/api/jobs/{job_id}")
-async def get_async_job(job_id: str, request: Request) -> dict:
+async def get_async_job(job_id: str, request: Request) -> Response:
     service = _get_async_job_service(request)
-    data: AsyncJobStatusData = await service.get_job(job_id)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data: AsyncJobStatusData | None = service.peek_job(job_id)
+    if data is None:
+        return _job_not_found_response(job_id, get_request_id())
+    return _success_response(data)
 
 
 @router.post("/api/jobs/{job_id}/retry")
-async def retry_async_job(job_id: str, request: Request) -> dict:
+async def retry_async_job(job_id: str, request: Request) -> Response:
     service = _get_async_job_service(request)
     data: AsyncJobCreateData = await service.retry_job(
         job_id=job_id,
-        request_id=request.state.request_id,
+        request_id=get_request_id(),
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/bilibili/summarize")
-async def bilibili_summarize(payload: BilibiliSummaryRequest, request: Request) -> dict:
+async def bilibili_summarize(payload: BilibiliSummaryRequest) -> Response:
     logger.info("Receive summarize request: %s", payload.video_url)
     summarizer = _get_summarizer()
     result = await summarizer.summarize(payload.video_url)
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.post("/api/notes/bilibili/save")
-async def save_bilibili_note(payload: BilibiliNoteSaveRequest, request: Request) -> dict:
+async def save_bilibili_note(payload: BilibiliNoteSaveRequest) -> Response:
     service = _get_note_library_service()
-    saved = service.save_bilibili_note(
+    # Note saves end with a full database backup; run them off the event loop.
+    saved = await asyncio.to_thread(
+        service.save_bilibili_note,
         video_url=payload.video_url,
         summary_markdown=payload.summary_markdown,
         elapsed_ms=payload.elapsed_ms,
         transcript_chars=payload.transcript_chars,
         title=payload.title,
     )
-    return success_response(data=saved.model_dump(), request_id=request.state.request_id)
+    return _success_response(saved)
 
 
 @router.get("/api/notes/bilibili")
-async def list_bilibili_notes(request: Request) -> dict:
+async def list_bilibili_notes(
+    limit: int | None = Query(default=None, ge=1, le=200),
+    cursor: str = Query(default=""),
+) -> Response:
     service = _get_note_library_service()
-    result = service.list_bilibili_notes()
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    result = service.list_bilibili_notes(limit=limit, cursor=cursor)
+    return _success_response(result)
 
 
 @router.get("/api/notes/search")
 async def search_notes(
-    request: Request,
     keyword: str = Query(default=""),
     source: str = Query(default=""),
     saved_from: str = Query(default=""),
@@ -428,7 +534,7 @@ async def search_notes(
     sort_order: str = Query(default="desc"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-) -> dict:
+) -> Response:
     service = _get_note_library_service()
     search_kwargs = dict(
         keyword=keyword,
@@ -447,33 +553,31 @@ async def search_notes(
     if sort_order and sort_order != "desc":
         search_kwargs["sort_order"] = sort_order
     result: UnifiedNotesData = service.search_notes(**search_kwargs)
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.get("/api/notes/review/topics")
 async def review_notes_topics(
-    request: Request,
     days: int = Query(default=30, ge=1, le=365),
     limit: int = Query(default=8, ge=1, le=50),
     per_topic_limit: int = Query(default=5, ge=1, le=20),
-) -> dict:
+) -> Response:
     service = _get_note_library_service()
     result: NotesReviewTopicsData = service.review_notes_by_topics(
         days=days,
         limit=limit,
         per_topic_limit=per_topic_limit,
     )
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.get("/api/notes/review/timeline")
 async def review_notes_timeline(
-    request: Request,
     days: int = Query(default=30, ge=1, le=365),
     bucket: str = Query(default="day"),
     limit: int = Query(default=10, ge=1, le=50),
     per_bucket_limit: int = Query(default=5, ge=1, le=20),
-) -> dict:
+) -> Response:
     service = _get_note_library_service()
     result: NotesTimelineReviewData = service.review_notes_by_timeline(
         days=days,
@@ -481,17 +585,16 @@ async def review_notes_timeline(
         limit=limit,
         per_bucket_limit=per_bucket_limit,
     )
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.get("/api/notes/{source}/{note_id}/related")
 async def get_related_notes(
     source: str,
     note_id: str,
-    request: Request,
     limit: int = Query(default=8, ge=1, le=50),
     min_score: float = Query(default=0.2, ge=0.0, le=1.0),
-) -> dict:
+) -> Response:
     service = _get_note_library_service()
     result: RelatedNotesData = service.find_related_notes(
         source=source,
@@ -499,169 +602,134 @@ async def get_related_notes(
         limit=limit,
         min_score=min_score,
     )
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.delete("/api/notes/bilibili/{note_id}")
-async def delete_bilibili_note(note_id: str, request: Request) -> dict:
+async def delete_bilibili_note(note_id: str) -> Response:
     service = _get_note_library_service()
     deleted_count = service.delete_bilibili_note(note_id)
-    data = NotesDeleteData(deleted_count=deleted_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = NotesDeleteData.model_construct(deleted_count=deleted_count)
+    return _success_response(data)
 
 
 @router.delete("/api/notes/bilibili")
-async def clear_bilibili_notes(request: Request) -> dict:
+async def clear_bilibili_notes() -> Response:
     service = _get_note_library_service()
     deleted_count = service.clear_bilibili_notes()
-    data = NotesDeleteData(deleted_count=deleted_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = NotesDeleteData.model_construct(deleted_count=deleted_count)
+    return _success_response(data)
 
 
 @router.post("/api/xiaohongshu/summarize-url")
-async def xiaohongshu_summarize_url(
-    payload: XiaohongshuUrlSummaryRequest, request: Request
-) -> dict:
+async def xiaohongshu_summarize_url(payload: XiaohongshuUrlSummaryRequest) -> Response:
     logger.info("Receive xiaohongshu summarize-url request")
     service = _get_xiaohongshu_service()
     result = await service.summarize_url(payload.url)
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    return _success_response(result)
 
 
 @router.post("/api/notes/xiaohongshu/save-batch")
-async def save_xiaohongshu_notes(
-    payload: XiaohongshuNotesSaveRequest, request: Request
-) -> dict:
+async def save_xiaohongshu_notes(payload: XiaohongshuNotesSaveRequest) -> Response:
     service = _get_note_library_service()
-    saved_count = service.save_xiaohongshu_notes(payload.notes)
-    data = NotesSaveBatchData(saved_count=saved_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    saved_count = await asyncio.to_thread(service.save_xiaohongshu_notes, payload.notes)
+    data = NotesSaveBatchData.model_construct(saved_count=saved_count)
+    return _success_response(data)
 
 
 @router.get("/api/notes/xiaohongshu")
-async def list_xiaohongshu_notes(request: Request) -> dict:
+async def list_xiaohongshu_notes(
+    limit: int | None = Query(default=None, ge=1, le=200),
+    cursor: str = Query(default=""),
+) -> Response:
     service = _get_note_library_service()
-    result = service.list_xiaohongshu_notes()
-    return success_response(data=result.model_dump(), request_id=request.state.request_id)
+    result = service.list_xiaohongshu_notes(limit=limit, cursor=cursor)
+    return _success_response(result)
 
 
 @router.delete("/api/notes/xiaohongshu/{note_id}")
-async def delete_xiaohongshu_note(note_id: str, request: Request) -> dict:
+async def delete_xiaohongshu_note(note_id: str) -> Response:
     service = _get_note_library_service()
     deleted_count = service.delete_xiaohongshu_note(note_id)
-    data = NotesDeleteData(deleted_count=deleted_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = NotesDeleteData.model_construct(deleted_count=deleted_count)
+    return _success_response(data)
 
 
 @router.delete("/api/notes/xiaohongshu")
-async def clear_xiaohongshu_notes(request: Request) -> dict:
+async def clear_xiaohongshu_notes() -> Response:
     service = _get_note_library_service()
     deleted_count = service.clear_xiaohongshu_notes()
-    data = NotesDeleteData(deleted_count=deleted_count)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = NotesDeleteData.model_construct(deleted_count=deleted_count)
+    return _success_response(data)
 
 
 @router.post("/api/notes/xiaohongshu/synced/prune")
-async def prune_unsaved_xiaohongshu_synced_notes(request: Request) -> dict:
+async def prune_unsaved_xiaohongshu_synced_notes() -> Response:
     service = _get_note_library_service()
-    result = service.prune_unsaved_xiaohongshu_synced_notes()
-    data = XiaohongshuSyncedNotesPruneData(
-        candidate_count=result.candidate_count,
-        deleted_count=result.deleted_count,
-    )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data: XiaohongshuSyncedNotesPruneData = service.prune_unsaved_xiaohongshu_synced_notes()
+    return _success_response(data)
 
 
 @router.post("/api/notes/merge/suggest")
-async def suggest_notes_merge(
-    payload: NotesMergeSuggestRequest, request: Request
-) -> dict:
+async def suggest_notes_merge(payload: NotesMergeSuggestRequest) -> Response:
     service = _get_note_library_service()
-    result = service.suggest_merge_candidates(
+    data: NotesMergeSuggestData = service.suggest_merge_candidates(
         source=payload.source,
         limit=payload.limit,
         min_score=payload.min_score,
         include_weak=payload.include_weak,
     )
-    data = NotesMergeSuggestData(total=result.total, items=result.items)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/notes/merge/preview")
-async def preview_notes_merge(
-    payload: NotesMergePreviewRequest, request: Request
-) -> dict:
+async def preview_notes_merge(payload: NotesMergePreviewRequest) -> Response:
     service = _get_note_library_service()
-    result = await service.preview_merge(source=payload.source, note_ids=payload.note_ids)
-    data = NotesMergePreviewData(
-        source=result.source,
-        note_ids=result.note_ids,
-        merged_title=result.merged_title,
-        merged_summary_markdown=result.merged_summary_markdown,
-        source_refs=result.source_refs,
-        conflict_markers=result.conflict_markers,
+    data: NotesMergePreviewData = await service.preview_merge(
+        source=payload.source,
+        note_ids=payload.note_ids,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/notes/merge/commit")
-async def commit_notes_merge(payload: NotesMergeCommitRequest, request: Request) -> dict:
+async def commit_notes_merge(payload: NotesMergeCommitRequest) -> Response:
     service = _get_note_library_service()
-    result = await service.commit_merge(
+    data: NotesMergeCommitData = await service.commit_merge(
         source=payload.source,
         note_ids=payload.note_ids,
         merged_title=payload.merged_title,
         merged_summary_markdown=payload.merged_summary_markdown,
     )
-    data = NotesMergeCommitData(
-        merge_id=result.merge_id,
-        status=result.status,
-        source=result.source,
-        merged_note_id=result.merged_note_id,
-        source_note_ids=result.source_note_ids,
-        can_rollback=result.can_rollback,
-        can_finalize=result.can_finalize,
-    )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/notes/merge/rollback")
-async def rollback_notes_merge(
-    payload: NotesMergeRollbackRequest, request: Request
-) -> dict:
+async def rollback_notes_merge(payload: NotesMergeRollbackRequest) -> Response:
     service = _get_note_library_service()
-    result = service.rollback_merge(merge_id=payload.merge_id)
-    data = NotesMergeRollbackData(
-        merge_id=result.merge_id,
-        status=result.status,
-        deleted_merged_count=result.deleted_merged_count,
-        restored_source_count=result.restored_source_count,
+    data: NotesMergeRollbackData = await asyncio.to_thread(
+        service.rollback_merge,
+        merge_id=payload.merge_id,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/notes/merge/finalize")
-async def finalize_notes_merge(
-    payload: NotesMergeFinalizeRequest, request: Request
-) -> dict:
+async def finalize_notes_merge(payload: NotesMergeFinalizeRequest) -> Response:
     service = _get_note_library_service()
-    result = service.finalize_merge(
+    data: NotesMergeFinalizeData = await asyncio.to_thread(
+        service.finalize_merge,
         merge_id=payload.merge_id,
         confirm_destructive=payload.confirm_destructive,
     )
-    data = NotesMergeFinalizeData(
-        merge_id=result.merge_id,
-        status=result.status,
-        deleted_source_count=result.deleted_source_count,
-        kept_merged_note_id=result.kept_merged_note_id,
-    )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/xiaohongshu/auth/update")
 async def update_xiaohongshu_auth(
-    payload: XiaohongshuAuthUpdateRequest, request: Request
-) -> dict:
+    request: Request,
+    payload: XiaohongshuAuthUpdateRequest,
+) -> Response:
     cookie = payload.cookie.strip()
     if not cookie:
         raise AppError(
@@ -670,35 +738,39 @@ async def update_xiaohongshu_auth(
             status_code=400,
         )
 
+    # Keys are inserted alphabetically so the dict order doubles as updated_keys.
     updates: dict[str, str] = {"XHS_HEADER_COOKIE": cookie}
-    if payload.user_agent.strip():
-        updates["XHS_HEADER_USER_AGENT"] = payload.user_agent.strip()
-    if payload.origin.strip():
-        updates["XHS_HEADER_ORIGIN"] = payload.origin.strip()
-    if payload.referer.strip():
-        updates["XHS_HEADER_REFERER"] = payload.referer.strip()
-
-    try:
-        xhs_capture_tool.upsert_env_file(xhs_capture_tool.DEFAULT_ENV_PATH, updates)
-    except Exception as exc:
-        logger.exception("Failed to persist xiaohongshu auth to .env.")
-        raise AppError(
-            code=ErrorCode.INTERNAL_ERROR,
-            message="写入小红书鉴权配置失败。",
-            status_code=500,
-            details={"error": str(exc)},
-        ) from exc
-
-    for key, value in updates.items():
-        if value:
-            os.environ[key] = value
-    _reload_runtime_services()
+    origin = payload.origin.strip()
+    if origin:
+        updates["XHS_HEADER_ORIGIN"] = origin
+    referer = payload.referer.strip()
+    if referer:
+        updates["XHS_HEADER_REFERER"] = referer
+    user_agent = payload.user_agent.strip()
+    if user_agent:
+        updates["XHS_HEADER_USER_AGENT"] = user_agent
+
+    async with _config_reload_lock:
+        try:
+            await asyncio.to_thread(
+                xhs_capture_tool.upsert_env_file, xhs_capture_tool.DEFAULT_ENV_PATH, updates
+            )
+        except Exception as exc:
+            logger.exception("Failed to persist xiaohongshu auth to .env.")
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                message="写入小红书鉴权配置失败。",
+                status_code=500,
+                details={"error": str(exc)},
+            ) from exc
+        _apply_env_updates_and_reload(updates)
 
     identity = await _probe_xiaohongshu_web_identity(
+        client=getattr(request.app.state, "xiaohongshu_probe_client", None),
         cookie=cookie,
-        user_agent=updates.get("XHS_HEADER_USER_AGENT", ""),
-        origin=updates.get("XHS_HEADER_ORIGIN", ""),
-        referer=updates.get("XHS_HEADER_REFERER", ""),
+        user_agent=user_agent,
+        origin=origin,
+        referer=referer,
     )
     if identity is not None:
         user_id, guest = identity
@@ -714,76 +786,75 @@ async def update_xiaohongshu_auth(
                 details=details,
             )
 
-    data = XiaohongshuAuthUpdateData(
-        updated_keys=sorted(updates.keys()),
+    data = XiaohongshuAuthUpdateData.model_construct(
+        updated_keys=list(updates),
         non_empty_keys=len(updates),
         cookie_pairs=_count_cookie_pairs(cookie),
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.post("/api/xiaohongshu/capture/refresh")
-async def refresh_xiaohongshu_capture(request: Request) -> dict:
-    try:
-        _capture_source, capture_path, capture, updates = (
-            xhs_capture_tool.apply_capture_from_default_auth_source_to_env(
-                require_cookie=True
+async def refresh_xiaohongshu_capture() -> Response:
+    async with _config_reload_lock:
+        try:
+            # HAR parsing and the .env rewrite are blocking file I/O.
+            _capture_source, capture_path, capture, updates = await asyncio.to_thread(
+                xhs_capture_tool.apply_capture_from_default_auth_source_to_env,
+                require_cookie=True,
             )
-        )
-    except ValueError as exc:
-        raise AppError(
-            code=ErrorCode.INVALID_INPUT,
-            message=str(exc),
-            status_code=400,
-        ) from exc
-    except Exception as exc:
-        logger.exception("Failed to refresh xiaohongshu capture from default HAR.")
-        raise AppError(
-            code=ErrorCode.INTERNAL_ERROR,
-            message="刷新小红书抓包配置失败。",
-            status_code=500,
-            details={"error": str(exc)},
-        ) from exc
-
-    for key, value in updates.items():
-        if value:
-            os.environ[key] = value
-    _reload_runtime_services()
+        except ValueError as exc:
+            raise AppError(
+                code=ErrorCode.INVALID_INPUT,
+                message=str(exc),
+                status_code=400,
+            ) from exc
+        except Exception as exc:
+            logger.exception("Failed to refresh xiaohongshu capture from default HAR.")
+            raise AppError(
+                code=ErrorCode.INTERNAL_ERROR,
+                message="刷新小红书抓包配置失败。",
+                status_code=500,
+                details={"error": str(exc)},
+            ) from exc
+        _apply_env_updates_and_reload(updates)
 
     empty_keys = sorted([key for key, value in updates.items() if not value])
-    data = XiaohongshuCaptureRefreshData(
+    data = XiaohongshuCaptureRefreshData.model_construct(
         har_path=str(capture_path),
-        request_url_host=urlparse(capture.request_url).netloc,
+        request_url_host=capture.request_host,
         request_method=capture.request_method,
-        headers_count=len(capture.request_headers),
+        headers_count=capture.headers_count,
         non_empty_keys=len(updates) - len(empty_keys),
         empty_keys=empty_keys,
     )
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    return _success_response(data)
 
 
 @router.get("/api/config/editable")
-async def get_editable_config(request: Request) -> dict:
+async def get_editable_config() -> Response:
     service = _get_editable_config_service()
-    data = EditableConfigData(settings=service.get_editable_settings())
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    data = EditableConfigData.model_construct(settings=service.get_editable_settings())
+    return _success_response(data)
 
 
 @router.put("/api/config/editable")
-async def update_editable_config(
-    payload: EditableConfigUpdateRequest, request: Request
-) -> dict:
+async def update_editable_config(payload: EditableConfigUpdateRequest) -> Response:
     service = _get_editable_config_service()
-    settings_data = service.update_editable_settings(payload.settings)
-    _reload_runtime_services()
-    data = EditableConfigData(settings=settings_data)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    async with _config_reload_lock:
+        settings_data = await asyncio.to_thread(
+            service.update_editable_settings, payload.settings
+        )
+        _reload_runtime_services()
+    data = EditableConfigData.model_construct(settings=settings_data)
+    return _success_response(data)
 
 
 @router.post("/api/config/editable/reset")
-async def reset_editable_config(request: Request) -> dict:
+async def reset_editable_config() -> Response:
     service = _get_editable_config_service()
-    settings_data = service.reset_to_defaults()
-    _reload_runtime_services()
-    data = EditableConfigData(settings=settings_data)
-    return success_response(data=data.model_dump(), request_id=request.state.request_id)
+    async with _config_reload_lock:
+        settings_data = await asyncio.to_thread(service.reset_to_defaults)
+        _reload_runtime_services()
+    data = EditableConfigData.model_construct(settings=settings_data)
+    return _success_response(data)
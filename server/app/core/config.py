@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
@@ -27,6 +28,9 @@ class ASRConfig(BaseModel):
     device: str = "cpu"
     model_size: str = "base"
     language: str = "zh"
+    compute_type: str = "auto"
+    cpu_threads: int = 0
+    batch_size: int = 0
 
 
 class BilibiliConfig(BaseModel):
@@ -139,6 +143,8 @@ class RuntimeConfig(BaseModel):
 
     temp_dir: str = ".tmp"
     log_level: str = "INFO"
+    async_job_workers: int = 1
+    profiling_enabled: bool = False
     backup: BackupConfig = Field(default_factory=BackupConfig)
 
 
@@ -172,6 +178,23 @@ class Settings(BaseModel):
 
 
 _ENV_VAR_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+# libyaml's C loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(frozen=True)
+class _SettingsSnapshot:
+    file_key: tuple[str, int, int]
+    env_names: tuple[str, ...]
+    env_values: tuple[str, ...]
+    settings: Settings
+
+
+# (path, mtime_ns, size) of the .env file last applied to os.environ.
+_dotenv_loaded_key: tuple[str, int, int] | None = None
+
+# Last parsed config; reused while the file and the env vars it references are unchanged.
+_settings_snapshot: _SettingsSnapshot | None = None
 
 
 def _project_root() -> Path:
@@ -186,11 +209,18 @@ def resolve_runtime_path(raw_path: str | Path) -> Path:
 
 
 def _load_dotenv(project_root: Path) -> None:
+    global _dotenv_loaded_key
+
     dotenv_path = project_root / ".env"
-    if not dotenv_path.exists():
+    try:
+        stat = dotenv_path.stat()
+    except FileNotFoundError:
+        return
+    loaded_key = (str(dotenv_path), stat.st_mtime_ns, stat.st_size)
+    if loaded_key == _dotenv_loaded_key:
         return
 
-    for raw_line in dotenv_path.read_text(encoding="utf-8").splitlines():
+    for raw_line in dotenv_path.read_bytes().decode("utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
@@ -206,19 +236,39 @@ def _load_dotenv(project_root: Path) -> None:
         value = value.strip()
         if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
             value = value[1:-1]
-        os.environ.setdefault(key, value)
+        if key not in os.environ:
+            os.environ[key] = value
+    _dotenv_loaded_key = loaded_key
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    return os.getenv(match.group(1), "")
 
 
 def _expand_env_vars(payload: object) -> object:
+    # Containers are only rebuilt when something below them was substituted.
+    if isinstance(payload, str):
+        if "${" not in payload:
+            return payload
+        return _ENV_VAR_PATTERN.sub(_replace_env_var, payload)
     if isinstance(payload, dict):
-        return {key: _expand_env_vars(value) for key, value in payload.items()}
+        expanded_dict: dict[object, object] | None = None
+        for key, value in payload.items():
+            new_value = _expand_env_vars(value)
+            if new_value is not value:
+                if expanded_dict is None:
+                    expanded_dict = dict(payload)
+                expanded_dict[key] = new_value
+        return payload if expanded_dict is None else expanded_dict
     if isinstance(payload, list):
-        return [_expand_env_vars(item) for item in payload]
-    if isinstance(payload, str):
-        return _ENV_VAR_PATTERN.sub(
-            lambda match: os.getenv(match.group(1), ""),
-            payload,
-        )
+        expanded_list: list[object] | None = None
+        for index, item in enumerate(payload):
+            new_item = _expand_env_vars(item)
+            if new_item is not item:
+                if expanded_list is None:
+                    expanded_list = list(payload)
+                expanded_list[index] = new_item
+        return payload if expanded_list is None else expanded_list
     return payload
 
 
@@ -238,15 +288,41 @@ def _resolve_config_path() -> Path:
     return fallback
 
 
+def _env_values(names: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(os.getenv(name, "") for name in names)
+
+
 def load_settings() -> Settings:
+    global _settings_snapshot
+
     config_path = _resolve_config_path()
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         return Settings()
 
-    with config_path.open("r", encoding="utf-8") as fp:
-        raw = yaml.safe_load(fp) or {}
-    expanded = _expand_env_vars(raw)
-    return Settings.model_validate(expanded)
+    file_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    snapshot = _settings_snapshot
+    if (
+        snapshot is not None
+        and snapshot.file_key == file_key
+        and snapshot.env_values == _env_values(snapshot.env_names)
+    ):
+        return snapshot.settings
+
+    data = config_path.read_bytes()
+    raw = yaml.load(data, Loader=_YAML_LOADER) or {}
+    settings = Settings.model_validate(_expand_env_vars(raw))
+    env_names: tuple[str, ...] = ()
+    if b"${" in data:
+        env_names = tuple(sorted(set(_ENV_VAR_PATTERN.findall(data.decode("utf-8")))))
+    _settings_snapshot = _SettingsSnapshot(
+        file_key=file_key,
+        env_names=env_names,
+        env_values=_env_values(env_names),
+        settings=settings,
+    )
+    return settings
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+_request_id_var: ContextVar[str] = ContextVar("request_id", default="")
+
+
+def get_request_id() -> str:
+    return _request_id_var.get()
+
+
+def set_request_id(request_id: str) -> None:
+    _request_id_var.set(request_id)
@@ -1,14 +1,54 @@
 from __future__ import annotations
 
+from decimal import Decimal
+from pathlib import PurePath
 from typing import Any
 
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
 from app.core.errors import ErrorCode
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_OK = ErrorCode.OK.value
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (PurePath, Exception)):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
+_SUCCESS_BODY_PREFIX = b'{"ok":true,"code":"' + _OK.encode() + b'","message":"","data":'
+
+
+def success_body(data: BaseModel, request_id: str) -> bytes:
+    """Render a success envelope around `data` serialized by pydantic-core."""
+    return b"".join(
+        (
+            _SUCCESS_BODY_PREFIX,
+            data.__pydantic_serializer__.to_json(data),
+            b',"request_id":',
+            orjson.dumps(request_id),
+            b"}",
+        )
+    )
+
 
 def success_response(data: dict[str, Any], request_id: str, message: str = "") -> dict[str, Any]:
     return {
         "ok": True,
-        "code": ErrorCode.OK.value,
+        "code": _OK,
         "message": message,
         "data": data,
         "request_id": request_id,
@@ -4,9 +4,9 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
 from app.api.routes import (
     router,
@@ -16,11 +16,13 @@ from app.api.routes import (
 from app.core.config import get_settings
 from app.core.errors import AppError, ErrorCode
 from app.core.logging import setup_logging
-from app.core.response import error_response
+from app.core.response import ORJSONResponse, error_response
 from app.middleware.access_token import AccessTokenMiddleware
+from app.middleware.profiling import ProfilingMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.services.async_jobs import AsyncJobService
 from app.services.database_backup import PeriodicDatabaseBackupService
+from app.services.llm import set_shared_client as set_llm_client
 
 settings = get_settings()
 setup_logging(settings.runtime.log_level)
@@ -35,28 +37,50 @@ async def lifespan(app: FastAPI):
         bilibili_runner=run_bilibili_summary_job,
         xiaohongshu_runner=run_xiaohongshu_summary_job,
     )
+    # Shared so repeated auth probes reuse pooled keep-alive connections.
+    xiaohongshu_probe_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+    # Shared by every LLMService so summaries reuse keep-alive connections to the LLM.
+    llm_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+    previous_llm_client = set_llm_client(llm_client)
     stop_event = asyncio.Event()
     backup_task = asyncio.create_task(backup_service.run(stop_event))
     await async_job_service.start()
     app.state.periodic_backup_service = backup_service
     app.state.periodic_backup_task = backup_task
     app.state.async_job_service = async_job_service
+    app.state.xiaohongshu_probe_client = xiaohongshu_probe_client
+    app.state.llm_client = llm_client
     try:
         yield
     finally:
         stop_event.set()
         await async_job_service.stop()
         await backup_task
+        await xiaohongshu_probe_client.aclose()
+        set_llm_client(previous_llm_client)
+        await llm_client.aclose()
 
 
-app = FastAPI(title="Midas Server", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="Midas Server",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+if settings.runtime.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
 app.add_middleware(RequestIDMiddleware)
 app.add_middleware(AccessTokenMiddleware)
 app.include_router(router)
 
 
 @app.exception_handler(AppError)
-async def handle_app_error(request: Request, exc: AppError) -> JSONResponse:
+async def handle_app_error(request: Request, exc: AppError) -> ORJSONResponse:
     logger.warning("AppError: %s - %s", exc.code.value, exc.message)
     payload = error_response(
         code=exc.code,
@@ -64,27 +88,33 @@ async def handle_app_error(request: Request, exc: AppError) -> JSONResponse:
         request_id=request.state.request_id,
         data=exc.details or None,
     )
-    return JSONResponse(status_code=exc.status_code, content=payload)
+    return ORJSONResponse(status_code=exc.status_code, content=payload)
 
 
 @app.exception_handler(RequestValidationError)
-async def handle_validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
-    logger.warning("ValidationError: %s", exc.errors())
+async def handle_validation_error(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    # Only loc/msg/type: dropping input and ctx keeps submitted values (cookies included)
+    # out of both the log and the response.
+    errors = [
+        {"loc": error["loc"], "msg": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
+    logger.warning("ValidationError: %s", errors)
     payload = error_response(
         code=ErrorCode.INVALID_INPUT,
         message="请求参数不合法。",
         request_id=request.state.request_id,
-        data={"errors": exc.errors()},
+        data={"errors": errors},
     )
-    return JSONResponse(status_code=422, content=payload)
+    return ORJSONResponse(status_code=422, content=payload)
 
 
 @app.exception_handler(Exception)
-async def handle_unexpected_error(request: Request, exc: Exception) -> JSONResponse:
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
     logger.exception("Unhandled exception: %s", exc)
     payload = error_response(
         code=ErrorCode.INTERNAL_ERROR,
         message="服务端发生未预期错误。",
         request_id=request.state.request_id,
     )
-    return JSONResponse(status_code=500, content=payload)
+    return ORJSONResponse(status_code=500, content=payload)
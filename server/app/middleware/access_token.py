@@ -3,11 +3,10 @@ from __future__ import annotations
 import hmac
 
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
 from app.core.config import get_settings
 from app.core.errors import ErrorCode
-from app.core.response import error_response
+from app.core.response import ORJSONResponse, error_response
 
 
 class AccessTokenMiddleware(BaseHTTPMiddleware):
@@ -26,7 +25,7 @@ class AccessTokenMiddleware(BaseHTTPMiddleware):
             message="访问令牌无效或缺失。",
             request_id=request_id,
         )
-        return JSONResponse(status_code=401, content=payload)
+        return ORJSONResponse(status_code=401, content=payload)
 
     def _extract_token(self, request) -> str:
         auth_header = request.headers.get("Authorization", "").strip()
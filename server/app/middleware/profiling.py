@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from starlette.datastructures import QueryParams
+from starlette.responses import HTMLResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.errors import ErrorCode
+from app.core.response import ORJSONResponse, error_response
+
+
+class ProfilingMiddleware:
+    """Profile a single request with pyinstrument when `?profile=1` is given.
+
+    Only registered when `runtime.profiling_enabled` is true; the rendered
+    HTML report replaces the normal response body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            QueryParams(scope["query_string"]).get("profile") != "1"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            payload = error_response(
+                code=ErrorCode.DEPENDENCY_MISSING,
+                message="缺少 pyinstrument 依赖，请先安装后重试。",
+                request_id=scope.get("state", {}).get("request_id", ""),
+            )
+            await ORJSONResponse(status_code=500, content=payload)(scope, receive, send)
+            return
+
+        async def discard(_message: Message) -> None:
+            return None
+
+        profiler = Profiler(async_mode="enabled", interval=0.001)
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+        await HTMLResponse(profiler.output_html())(scope, receive, send)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
+VideoUrl = Annotated[str, Field(min_length=3, max_length=2000)]
+
 
 class HealthData(BaseModel):
     status: str = "ok"
@@ -177,7 +179,7 @@ class AssetCurrentUpdateRequest(BaseModel):
 
 
 class BilibiliSummaryRequest(BaseModel):
-    video_url: str = Field(min_length=3, max_length=2000)
+    video_url: VideoUrl
 
 
 class BilibiliSummaryData(BaseModel):
@@ -242,7 +244,7 @@ class AsyncJobStatusData(BaseModel):
 
 
 class BilibiliNoteSaveRequest(BaseModel):
-    video_url: str = Field(min_length=3, max_length=2000)
+    video_url: VideoUrl
     summary_markdown: str = Field(min_length=1)
     elapsed_ms: int = Field(ge=0)
     transcript_chars: int = Field(ge=0)
@@ -262,6 +264,7 @@ class BilibiliSavedNote(BaseModel):
 class BilibiliSavedNotesData(BaseModel):
     total: int
     items: list[BilibiliSavedNote]
+    next_cursor: str = ""
 
 
 class UnifiedNoteItem(BaseModel):
@@ -363,6 +366,7 @@ class XiaohongshuSavedNote(BaseModel):
 class XiaohongshuSavedNotesData(BaseModel):
     total: int
     items: list[XiaohongshuSavedNote]
+    next_cursor: str = ""
 
 
 class NotesDeleteData(BaseModel):
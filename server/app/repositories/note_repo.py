@@ -1,12 +1,88 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 import shutil
+import threading
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from app.repositories.sqlite_conn import open_connection, transaction
+
+# Bump whenever _init_tables gains DDL, so existing databases pick it up once.
+_SCHEMA_VERSION = 1
+
+# Column order of the note list SELECTs, zipped onto plain tuple rows.
+_BILIBILI_NOTE_COLUMNS = (
+    "note_id",
+    "title",
+    "video_url",
+    "summary_markdown",
+    "elapsed_ms",
+    "transcript_chars",
+    "saved_at",
+)
+_XIAOHONGSHU_NOTE_COLUMNS = ("note_id", "title", "source_url", "summary_markdown", "saved_at")
+
+
+def _fetch_plain_rows(conn: sqlite3.Connection, sql: str, params: Any) -> list[tuple[Any, ...]]:
+    # Bypass the connection's sqlite3.Row factory for hot list reads.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchall()
+
+
+def _dumps_json_text(value: Any) -> str:
+    # TEXT columns need str; orjson emits UTF-8 bytes without ASCII escaping.
+    return orjson.dumps(value).decode("utf-8")
+
+
+def _json_id_list(ids: list[str]) -> str:
+    # Bound as one JSON array and expanded with json_each, so the statement text stays
+    # constant and is not limited by SQLITE_MAX_VARIABLE_NUMBER.
+    return _dumps_json_text(ids)
+
+
+def _keyset_list_sql(table: str, columns: str) -> tuple[str, str]:
+    # Built once per table: (first page, page after cursor). Reusing the same statement
+    # text keeps both variants hot in the connection's statement cache.
+    # Seek past the cursor note on (saved_at, rowid) so the saved_at index serves each page.
+    template = f"""
+        SELECT {columns}
+        FROM {table} AS notes
+        {{where}}
+        ORDER BY notes.saved_at DESC, notes.rowid DESC
+        LIMIT ?
+    """
+    after_cursor = (
+        "WHERE (notes.saved_at, notes.rowid) < "
+        f"(SELECT saved_at, rowid FROM {table} WHERE note_id = ?)"
+    )
+    return template.format(where=""), template.format(where=after_cursor)
+
+
+def _keyset_params(limit: int | None, after_note_id: str) -> list[Any]:
+    params: list[Any] = [after_note_id] if after_note_id else []
+    params.append(-1 if limit is None else limit)
+    return params
+
+
+_LIST_BILIBILI_NOTES_SQL = _keyset_list_sql(
+    "saved_bilibili_notes",
+    """note_id, title, video_url, summary_markdown, elapsed_ms, transcript_chars,
+           strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at""",
+)
+_LIST_XIAOHONGSHU_NOTES_SQL = _keyset_list_sql(
+    "saved_xiaohongshu_notes",
+    """note_id, title, source_url, summary_markdown,
+           strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at""",
+)
+
 
 class NoteLibraryRepository:
     def __init__(self, db_path: str) -> None:
@@ -14,15 +90,29 @@ class NoteLibraryRepository:
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._backup_dir = self._db_path.parent / "backups"
         self._backup_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_tables()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
+    def _thread_connection(self) -> sqlite3.Connection:
+        # One autocommit connection per thread; transactions are opened explicitly.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = open_connection(self._db_path)
+            self._local.conn = conn
         return conn
 
+    def _connect(self, *, immediate: bool = False) -> AbstractContextManager[sqlite3.Connection]:
+        return transaction(self._thread_connection(), immediate=immediate)
+
+    def write_batch(self) -> AbstractContextManager[sqlite3.Connection]:
+        # Repository writes issued inside share one IMMEDIATE transaction.
+        return self._connect(immediate=True)
+
     def _init_tables(self) -> None:
-        with self._connect() as conn:
+        conn = self._thread_connection()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS saved_bilibili_notes (
@@ -109,7 +199,20 @@ class NoteLibraryRepository:
                 )
                 """
             )
-            conn.commit()
+            # Listing sorts by the raw saved_at column; the rowid tie-break rides on the index.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bili_saved_at "
+                "ON saved_bilibili_notes(saved_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_xhs_saved_at "
+                "ON saved_xiaohongshu_notes(saved_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_merge_source_ts "
+                "ON note_merge_history(source, created_at)"
+            )
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def save_bilibili_note(
         self,
@@ -121,7 +224,7 @@ class NoteLibraryRepository:
         elapsed_ms: int,
         transcript_chars: int,
     ) -> None:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 INSERT INTO saved_bilibili_notes
@@ -137,7 +240,6 @@ class NoteLibraryRepository:
                     transcript_chars,
                 ),
             )
-            conn.commit()
 
     def upsert_asset_snapshot(
         self,
@@ -147,7 +249,7 @@ class NoteLibraryRepository:
         total_amount_wan: float,
         amounts: dict[str, float],
     ) -> None:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 INSERT INTO asset_snapshot_history
@@ -166,7 +268,6 @@ class NoteLibraryRepository:
                     json.dumps(amounts, ensure_ascii=False, sort_keys=True),
                 ),
             )
-            conn.commit()
 
     def list_asset_snapshots(self) -> list[dict[str, Any]]:
         with self._connect() as conn:
@@ -190,12 +291,11 @@ class NoteLibraryRepository:
         return items
 
     def delete_asset_snapshot(self, record_id: str) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 "DELETE FROM asset_snapshot_history WHERE id = ?",
                 (record_id,),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def get_asset_current(self) -> dict[str, Any] | None:
@@ -225,7 +325,7 @@ class NoteLibraryRepository:
         total_amount_wan: float,
         amounts: dict[str, float],
     ) -> None:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 INSERT INTO asset_stats_current
@@ -241,23 +341,38 @@ class NoteLibraryRepository:
                     json.dumps(amounts, ensure_ascii=False, sort_keys=True),
                 ),
             )
-            conn.commit()
+
+    def optimize(self) -> None:
+        # Refresh planner statistics; analysis_limit bounds ANALYZE to a sample per index.
+        self._thread_connection().executescript("PRAGMA analysis_limit = 1000; ANALYZE;")
 
     def backup_database(self, *, keep_latest_files: int | None = None) -> Path:
         suffix = self._db_path.suffix or ".db"
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_path = self._backup_dir / f"{self._db_path.stem}_{timestamp}{suffix}"
 
-        with self._connect() as source_conn:
-            with sqlite3.connect(str(backup_path)) as backup_conn:
-                source_conn.backup(backup_conn)
-                backup_conn.commit()
+        backup_conn = sqlite3.connect(str(backup_path))
+        try:
+            self._thread_connection().backup(backup_conn)
+        finally:
+            backup_conn.close()
 
         latest_path = self._backup_dir / f"{self._db_path.stem}_latest{suffix}"
-        shutil.copy2(backup_path, latest_path)
+        self._publish_latest_backup(backup_path, latest_path)
         self._prune_timestamp_backups(keep_latest_files=keep_latest_files, suffix=suffix)
         return backup_path
 
+    def _publish_latest_backup(self, backup_path: Path, latest_path: Path) -> None:
+        # Hard-link the fresh backup and swap it in atomically; copy only when the
+        # filesystem refuses links.
+        staging_path = latest_path.with_name(f"{latest_path.name}.tmp")
+        staging_path.unlink(missing_ok=True)
+        try:
+            os.link(backup_path, staging_path)
+        except OSError:
+            shutil.copy2(backup_path, staging_path)
+        os.replace(staging_path, latest_path)
+
     def _prune_timestamp_backups(
         self,
         *,
@@ -279,53 +394,52 @@ class NoteLibraryRepository:
         for path in backups[keep_count:]:
             path.unlink(missing_ok=True)
 
-    def list_bilibili_notes(self) -> list[dict[str, Any]]:
+    def list_bilibili_notes(
+        self,
+        *,
+        limit: int | None = None,
+        after_note_id: str = "",
+    ) -> list[dict[str, Any]]:
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT note_id, title, video_url, summary_markdown, elapsed_ms,
-                       transcript_chars,
-                       strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at
-                FROM saved_bilibili_notes
-                ORDER BY saved_at DESC, rowid DESC
-                """
-            ).fetchall()
-        return [dict(row) for row in rows]
+            rows = _fetch_plain_rows(
+                conn,
+                _LIST_BILIBILI_NOTES_SQL[bool(after_note_id)],
+                _keyset_params(limit, after_note_id),
+            )
+        return [dict(zip(_BILIBILI_NOTE_COLUMNS, row)) for row in rows]
 
     def get_bilibili_notes_by_ids(self, note_ids: list[str]) -> list[dict[str, Any]]:
         if not note_ids:
             return []
-        placeholders = ",".join("?" for _ in note_ids)
         with self._connect() as conn:
-            rows = conn.execute(
-                f"""
+            rows = _fetch_plain_rows(
+                conn,
+                """
                 SELECT note_id, title, video_url, summary_markdown, elapsed_ms,
                        transcript_chars,
                        strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at
                 FROM saved_bilibili_notes
-                WHERE note_id IN ({placeholders})
+                WHERE note_id IN (SELECT value FROM json_each(?))
                 """,
-                tuple(note_ids),
-            ).fetchall()
-        return [dict(row) for row in rows]
+                (_json_id_list(note_ids),),
+            )
+        return [dict(zip(_BILIBILI_NOTE_COLUMNS, row)) for row in rows]
 
     def delete_bilibili_note(self, note_id: str) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 "DELETE FROM saved_bilibili_notes WHERE note_id = ?",
                 (note_id,),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def clear_bilibili_notes(self) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute("DELETE FROM saved_bilibili_notes")
-            conn.commit()
             return int(cursor.rowcount)
 
     def update_bilibili_note_summary(self, *, note_id: str, summary_markdown: str) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 """
                 UPDATE saved_bilibili_notes
@@ -334,20 +448,29 @@ class NoteLibraryRepository:
                 """,
                 (summary_markdown, note_id),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def save_xiaohongshu_notes(self, notes: list[dict[str, str]]) -> int:
         if not notes:
             return 0
-        with self._connect() as conn:
-            conn.executemany(
+        # Unchanged notes are left alone, so rowcount is the number of notes inserted
+        # or actually updated.
+        with self._connect(immediate=True) as conn:
+            cursor = conn.executemany(
                 """
-                INSERT OR REPLACE INTO saved_xiaohongshu_notes
+                INSERT INTO saved_xiaohongshu_notes
                 (note_id, title, source_url, summary_markdown)
                 VALUES (?, ?, ?, ?)
+                ON CONFLICT(note_id) DO UPDATE SET
+                    title = excluded.title,
+                    source_url = excluded.source_url,
+                    summary_markdown = excluded.summary_markdown,
+                    saved_at = excluded.saved_at
+                WHERE title IS NOT excluded.title
+                   OR source_url IS NOT excluded.source_url
+                   OR summary_markdown IS NOT excluded.summary_markdown
                 """,
-                [
+                (
                     (
                         item["note_id"],
                         item["title"],
@@ -355,22 +478,23 @@ class NoteLibraryRepository:
                         item["summary_markdown"],
                     )
                     for item in notes
-                ],
+                ),
             )
-            conn.commit()
-        return len(notes)
+            return int(cursor.rowcount)
 
-    def list_xiaohongshu_notes(self) -> list[dict[str, Any]]:
+    def list_xiaohongshu_notes(
+        self,
+        *,
+        limit: int | None = None,
+        after_note_id: str = "",
+    ) -> list[dict[str, Any]]:
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT note_id, title, source_url, summary_markdown,
-                       strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at
-                FROM saved_xiaohongshu_notes
-                ORDER BY saved_at DESC, rowid DESC
-                """
-            ).fetchall()
-        return [dict(row) for row in rows]
+            rows = _fetch_plain_rows(
+                conn,
+                _LIST_XIAOHONGSHU_NOTES_SQL[bool(after_note_id)],
+                _keyset_params(limit, after_note_id),
+            )
+        return [dict(zip(_XIAOHONGSHU_NOTE_COLUMNS, row)) for row in rows]
 
     def search_notes(
         self,
@@ -557,36 +681,34 @@ class NoteLibraryRepository:
     def get_xiaohongshu_notes_by_ids(self, note_ids: list[str]) -> list[dict[str, Any]]:
         if not note_ids:
             return []
-        placeholders = ",".join("?" for _ in note_ids)
         with self._connect() as conn:
-            rows = conn.execute(
-                f"""
+            rows = _fetch_plain_rows(
+                conn,
+                """
                 SELECT note_id, title, source_url, summary_markdown,
                        strftime('%Y-%m-%d %H:%M:%S', datetime(saved_at, '+8 hours')) AS saved_at
                 FROM saved_xiaohongshu_notes
-                WHERE note_id IN ({placeholders})
+                WHERE note_id IN (SELECT value FROM json_each(?))
                 """,
-                tuple(note_ids),
-            ).fetchall()
-        return [dict(row) for row in rows]
+                (_json_id_list(note_ids),),
+            )
+        return [dict(zip(_XIAOHONGSHU_NOTE_COLUMNS, row)) for row in rows]
 
     def delete_xiaohongshu_note(self, note_id: str) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 "DELETE FROM saved_xiaohongshu_notes WHERE note_id = ?",
                 (note_id,),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def clear_xiaohongshu_notes(self) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute("DELETE FROM saved_xiaohongshu_notes")
-            conn.commit()
             return int(cursor.rowcount)
 
     def update_xiaohongshu_note_summary(self, *, note_id: str, summary_markdown: str) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 """
                 UPDATE saved_xiaohongshu_notes
@@ -595,31 +717,28 @@ class NoteLibraryRepository:
                 """,
                 (summary_markdown, note_id),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def delete_bilibili_notes(self, note_ids: list[str]) -> int:
         if not note_ids:
             return 0
-        placeholders = ",".join("?" for _ in note_ids)
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
-                f"DELETE FROM saved_bilibili_notes WHERE note_id IN ({placeholders})",
-                tuple(note_ids),
+                "DELETE FROM saved_bilibili_notes "
+                "WHERE note_id IN (SELECT value FROM json_each(?))",
+                (_json_id_list(note_ids),),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def delete_xiaohongshu_notes(self, note_ids: list[str]) -> int:
         if not note_ids:
             return 0
-        placeholders = ",".join("?" for _ in note_ids)
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
-                f"DELETE FROM saved_xiaohongshu_notes WHERE note_id IN ({placeholders})",
-                tuple(note_ids),
+                "DELETE FROM saved_xiaohongshu_notes "
+                "WHERE note_id IN (SELECT value FROM json_each(?))",
+                (_json_id_list(note_ids),),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def save_merge_history(
@@ -635,7 +754,7 @@ class NoteLibraryRepository:
         rollback_of: str = "",
         operator: str = "system",
     ) -> None:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 INSERT INTO note_merge_history (
@@ -648,15 +767,14 @@ class NoteLibraryRepository:
                     merge_id,
                     source,
                     status,
-                    json.dumps(source_note_ids, ensure_ascii=False),
+                    _dumps_json_text(source_note_ids),
                     merged_note_id,
-                    json.dumps(field_decisions or {}, ensure_ascii=False),
+                    _dumps_json_text(field_decisions or {}),
                     fallback_reason,
                     rollback_of,
                     operator,
                 ),
             )
-            conn.commit()
 
     def get_merge_history(self, merge_id: str) -> dict[str, Any] | None:
         with self._connect() as conn:
@@ -722,7 +840,7 @@ class NoteLibraryRepository:
             set_clause += ", rollback_of = ?"
             params.append(rollback_of)
         params.append(merge_id)
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 f"""
                 UPDATE note_merge_history
@@ -731,7 +849,6 @@ class NoteLibraryRepository:
                 """,
                 tuple(params),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def update_merge_history_field_decisions(
@@ -740,16 +857,15 @@ class NoteLibraryRepository:
         merge_id: str,
         field_decisions: dict[str, Any],
     ) -> int:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 """
                 UPDATE note_merge_history
                 SET field_decisions = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE merge_id = ?
                 """,
-                (json.dumps(field_decisions or {}, ensure_ascii=False), merge_id),
+                (_dumps_json_text(field_decisions or {}), merge_id),
             )
-            conn.commit()
             return int(cursor.rowcount)
 
     def upsert_source_index_links(
@@ -773,7 +889,7 @@ class NoteLibraryRepository:
             rows.append((platform, source_value, canonical, merge_id, state))
         if not rows:
             return
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.executemany(
                 """
                 INSERT INTO note_source_index (
@@ -788,7 +904,6 @@ class NoteLibraryRepository:
                 """,
                 rows,
             )
-            conn.commit()
 
     def get_source_index_links(
         self,
@@ -799,16 +914,15 @@ class NoteLibraryRepository:
         normalized = [item.strip() for item in source_note_ids if item.strip()]
         if not normalized:
             return {}
-        placeholders = ",".join("?" for _ in normalized)
         with self._connect() as conn:
             rows = conn.execute(
-                f"""
+                """
                 SELECT platform, source_note_id, canonical_note_id, merge_id, state, updated_at
                 FROM note_source_index
                 WHERE platform = ?
-                  AND source_note_id IN ({placeholders})
+                  AND source_note_id IN (SELECT value FROM json_each(?))
                 """,
-                tuple([platform, *normalized]),
+                (platform, _json_id_list(normalized)),
             ).fetchall()
         output: dict[str, dict[str, Any]] = {}
         for row in rows:
@@ -839,32 +953,18 @@ class NoteLibraryRepository:
         return [str(row["source_note_id"]).strip() for row in rows if str(row["source_note_id"]).strip()]
 
     def prune_unsaved_xiaohongshu_synced_notes(self) -> tuple[int, int]:
-        with self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT COUNT(*) AS candidate_count
-                FROM xiaohongshu_synced_notes AS synced
-                LEFT JOIN saved_xiaohongshu_notes AS saved
-                  ON saved.note_id = synced.note_id
-                WHERE saved.note_id IS NULL
-                """
-            ).fetchone()
-            candidate_count = int(row["candidate_count"]) if row is not None else 0
-            if candidate_count <= 0:
-                return 0, 0
-
+        # One pass: the delete and its count come from the same statement, so a
+        # concurrent sync cannot slip in between a count and the delete.
+        with self._connect(immediate=True) as conn:
             cursor = conn.execute(
                 """
                 DELETE FROM xiaohongshu_synced_notes
-                WHERE note_id IN (
-                    SELECT synced.note_id
-                    FROM xiaohongshu_synced_notes AS synced
-                    LEFT JOIN saved_xiaohongshu_notes AS saved
-                      ON saved.note_id = synced.note_id
-                    WHERE saved.note_id IS NULL
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM saved_xiaohongshu_notes AS saved
+                    WHERE saved.note_id = xiaohongshu_synced_notes.note_id
                 )
                 """
             )
-            conn.commit()
             deleted_count = int(cursor.rowcount)
-            return candidate_count, deleted_count
+        return deleted_count, deleted_count
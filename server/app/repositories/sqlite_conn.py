@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# WAL lets reads run alongside a writer; NORMAL only fsyncs at checkpoints.
+# journal_mode persists in the database file; the rest apply per connection.
+_CONNECTION_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -20000;
+"""
+
+
+def open_connection(db_path: Path) -> sqlite3.Connection:
+    # Autocommit: callers open transactions explicitly. The default 5s timeout
+    # doubles as busy_timeout.
+    conn = sqlite3.connect(str(db_path), isolation_level=None, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
+@contextmanager
+def transaction(
+    conn: sqlite3.Connection,
+    *,
+    immediate: bool = False,
+) -> Iterator[sqlite3.Connection]:
+    if conn.in_transaction:
+        # Nested use joins the enclosing transaction, which owns COMMIT/ROLLBACK.
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
@@ -1,22 +1,60 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import AbstractContextManager
 from pathlib import Path
 
+from app.repositories.sqlite_conn import open_connection, transaction
+
+# Statements issued on every sync iteration; each connection's statement cache
+# (cached_statements=256) keeps them prepared across calls.
+# One statement for both lookups; each side is a primary-key probe.
+_IS_SYNCED_SQL = """
+    SELECT 1 FROM xiaohongshu_synced_notes WHERE note_id = ?
+    UNION ALL
+    SELECT 1
+    FROM note_source_index
+    WHERE platform = 'xiaohongshu'
+      AND source_note_id = ?
+    LIMIT 1
+"""
+_MARK_SYNCED_SQL = """
+    INSERT OR REPLACE INTO xiaohongshu_synced_notes (note_id, title, source_url)
+    VALUES (?, ?, ?)
+"""
+_GET_STATE_SQL = """
+    SELECT state_value FROM xiaohongshu_runtime_state
+    WHERE state_key = ?
+    LIMIT 1
+"""
+_SET_STATE_SQL = """
+    INSERT OR REPLACE INTO xiaohongshu_runtime_state (state_key, state_value)
+    VALUES (?, ?)
+"""
+
 
 class XiaohongshuSyncRepository:
     def __init__(self, db_path: str) -> None:
         self._db_path = Path(db_path).expanduser()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_tables()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
+    def _thread_connection(self) -> sqlite3.Connection:
+        # Reused per thread like NoteLibraryRepository, keeping the page and
+        # statement caches warm across the sync loop's is_synced/mark_synced calls.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = open_connection(self._db_path)
+            self._local.conn = conn
         return conn
 
+    def _connect(self, *, immediate: bool = False) -> AbstractContextManager[sqlite3.Connection]:
+        return transaction(self._thread_connection(), immediate=immediate)
+
     def _init_tables(self) -> None:
-        with self._connect() as conn:
+        with self._connect(immediate=True) as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS xiaohongshu_synced_notes (
@@ -49,63 +87,26 @@ class XiaohongshuSyncRepository:
                 )
                 """
             )
-            conn.commit()
 
     def is_synced(self, note_id: str) -> bool:
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM xiaohongshu_synced_notes WHERE note_id = ? LIMIT 1",
-                (note_id,),
-            ).fetchone()
-            if row is not None:
-                return True
-            linked = conn.execute(
-                """
-                SELECT 1
-                FROM note_source_index
-                WHERE platform = 'xiaohongshu'
-                  AND source_note_id = ?
-                LIMIT 1
-                """,
-                (note_id,),
-            ).fetchone()
-        return linked is not None
+            row = conn.execute(_IS_SYNCED_SQL, (note_id, note_id)).fetchone()
+        return row is not None
 
     def mark_synced(self, note_id: str, title: str, source_url: str) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO xiaohongshu_synced_notes (note_id, title, source_url)
-                VALUES (?, ?, ?)
-                """,
-                (note_id, title, source_url),
-            )
-            conn.commit()
+        with self._connect(immediate=True) as conn:
+            conn.execute(_MARK_SYNCED_SQL, (note_id, title, source_url))
 
     def get_state(self, state_key: str) -> str | None:
         with self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT state_value FROM xiaohongshu_runtime_state
-                WHERE state_key = ?
-                LIMIT 1
-                """,
-                (state_key,),
-            ).fetchone()
+            row = conn.execute(_GET_STATE_SQL, (state_key,)).fetchone()
         if row is None:
             return None
-        return str(row["state_value"])
+        return row[0]
 
     def set_state(self, state_key: str, state_value: str) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO xiaohongshu_runtime_state (state_key, state_value)
-                VALUES (?, ?)
-                """,
-                (state_key, state_value),
-            )
-            conn.commit()
+        with self._connect(immediate=True) as conn:
+            conn.execute(_SET_STATE_SQL, (state_key, state_value))
 
     def resolve_canonical_note_id(self, source_note_id: str) -> str | None:
         with self._connect() as conn:
@@ -121,7 +122,7 @@ class XiaohongshuSyncRepository:
             ).fetchone()
         if row is None:
             return None
-        value = str(row["canonical_note_id"]).strip()
+        value = row[0].strip()
         return value or None
 
     def get_saved_note_summary(
@@ -140,9 +141,11 @@ class XiaohongshuSyncRepository:
             ).fetchone()
         if row is None:
             return None
+        # Positional reads: the SELECT fixes the column order, and TEXT columns
+        # already come back as str.
         return {
-            "note_id": str(row["note_id"]),
-            "title": str(row["title"]),
-            "source_url": str(row["source_url"]),
-            "summary_markdown": str(row["summary_markdown"]),
+            "note_id": row[0],
+            "title": row[1],
+            "source_url": row[2],
+            "summary_markdown": row[3],
         }
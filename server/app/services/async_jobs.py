@@ -5,7 +5,7 @@ import json
 import logging
 import tempfile
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -45,6 +45,26 @@ def _now_text() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _job_sort_key(record: dict[str, Any]) -> tuple[str, str]:
+    return str(record.get("submitted_at", "")), str(record.get("job_id", ""))
+
+
+def job_not_found_message(job_id: str) -> str:
+    return f"未找到 job_id={job_id} 对应的任务。"
+
+
+def _normalize_error_record(raw: Any) -> dict[str, Any] | None:
+    """Coerce a persisted error entry into the shape `_run_job` writes."""
+    if not isinstance(raw, dict):
+        return None
+    details = raw.get("details")
+    return {
+        "code": str(raw.get("code", "")).strip(),
+        "message": str(raw.get("message", "")).strip(),
+        "details": details if isinstance(details, dict) else None,
+    }
+
+
 class AsyncJobService:
     def __init__(
         self,
@@ -60,20 +80,24 @@ class AsyncJobService:
         self._queue: asyncio.Queue[str | None] = asyncio.Queue()
         self._jobs_by_id: dict[str, dict[str, Any]] = {}
         self._write_lock = asyncio.Lock()
-        self._worker_task: asyncio.Task[None] | None = None
+        self._worker_count = max(int(settings.runtime.async_job_workers), 1)
+        self._worker_tasks: list[asyncio.Task[None]] = []
 
     async def start(self) -> None:
         self._store_path.parent.mkdir(parents=True, exist_ok=True)
         await self._load_store()
         await self._recover_incomplete_jobs()
-        self._worker_task = asyncio.create_task(self._worker_loop())
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self._worker_count)
+        ]
 
     async def stop(self) -> None:
-        if self._worker_task is None:
+        if not self._worker_tasks:
             return
-        await self._queue.put(None)
-        await self._worker_task
-        self._worker_task = None
+        for _ in self._worker_tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._worker_tasks)
+        self._worker_tasks = []
 
     async def create_bilibili_summary_job(
         self, *, video_url: str, request_id: str
@@ -113,13 +137,7 @@ class AsyncJobService:
             )
 
         items = list(self._jobs_by_id.values())
-        items.sort(
-            key=lambda item: (
-                str(item.get("submitted_at", "")),
-                str(item.get("job_id", "")),
-            ),
-            reverse=True,
-        )
+        items.sort(key=_job_sort_key, reverse=True)
         filtered: list[AsyncJobListItem] = []
         total = 0
         for item in items:
@@ -130,16 +148,23 @@ class AsyncJobService:
             total += 1
             if len(filtered) < limit:
                 filtered.append(self._to_list_item(item))
-        return AsyncJobListData(total=total, items=filtered)
+        return AsyncJobListData.model_construct(total=total, items=filtered)
 
     async def get_job(self, job_id: str) -> AsyncJobStatusData:
-        record = self._jobs_by_id.get(job_id)
-        if record is None:
+        status = self.peek_job(job_id)
+        if status is None:
             raise AppError(
                 code=ErrorCode.JOB_NOT_FOUND,
-                message=f"未找到 job_id={job_id} 对应的任务。",
+                message=job_not_found_message(job_id),
                 status_code=404,
             )
+        return status
+
+    def peek_job(self, job_id: str) -> AsyncJobStatusData | None:
+        # Records only change on the loop thread, so polling can read without awaiting.
+        record = self._jobs_by_id.get(job_id)
+        if record is None:
+            return None
         return self._to_status_data(record)
 
     async def retry_job(self, job_id: str, *, request_id: str) -> AsyncJobCreateData:
@@ -147,7 +172,7 @@ class AsyncJobService:
         if record is None:
             raise AppError(
                 code=ErrorCode.JOB_NOT_FOUND,
-                message=f"未找到 job_id={job_id} 对应的任务。",
+                message=job_not_found_message(job_id),
                 status_code=404,
             )
         status = str(record.get("status", "")).strip().upper()
@@ -210,10 +235,9 @@ class AsyncJobService:
             "result": None,
             "error": None,
         }
-        self._jobs_by_id[job_id] = record
-        await self._persist_store()
+        await self._publish_record(record)
         await self._queue.put(job_id)
-        return AsyncJobCreateData(
+        return AsyncJobCreateData.model_construct(
             job_id=job_id,
             job_type=job_type,
             status=_STATUS_PENDING,
@@ -241,47 +265,59 @@ class AsyncJobService:
         if record.get("status") != _STATUS_PENDING:
             return
 
-        record["status"] = _STATUS_RUNNING
-        record["started_at"] = _now_text()
-        record["message"] = "任务执行中。"
-        await self._persist_store()
+        record = {
+            **record,
+            "status": _STATUS_RUNNING,
+            "started_at": _now_text(),
+            "message": "任务执行中。",
+        }
+        await self._publish_record(record)
 
         try:
             result = await self._execute_job(record)
         except AppError as exc:
             logger.warning("Async job failed: job_id=%s code=%s", job_id, exc.code.value)
-            record["status"] = _STATUS_FAILED
-            record["finished_at"] = _now_text()
-            record["message"] = exc.message
-            self._sync_progress_from_result(record)
-            record["error"] = {
-                "code": exc.code.value,
+            record = {
+                **record,
+                "status": _STATUS_FAILED,
+                "finished_at": _now_text(),
                 "message": exc.message,
-                "details": exc.details or None,
+                "error": {
+                    "code": exc.code.value,
+                    "message": exc.message,
+                    "details": exc.details or None,
+                },
             }
-            await self._persist_store()
+            self._sync_progress_from_result(record)
+            await self._publish_record(record)
             return
         except Exception as exc:  # noqa: BLE001
             logger.exception("Async job crashed: job_id=%s", job_id)
-            record["status"] = _STATUS_FAILED
-            record["finished_at"] = _now_text()
-            record["message"] = "任务执行失败。"
-            self._sync_progress_from_result(record)
-            record["error"] = {
-                "code": ErrorCode.INTERNAL_ERROR.value,
-                "message": "服务端发生未预期错误。",
-                "details": {"error": str(exc)},
+            record = {
+                **record,
+                "status": _STATUS_FAILED,
+                "finished_at": _now_text(),
+                "message": "任务执行失败。",
+                "error": {
+                    "code": ErrorCode.INTERNAL_ERROR.value,
+                    "message": "服务端发生未预期错误。",
+                    "details": {"error": str(exc)},
+                },
             }
-            await self._persist_store()
+            self._sync_progress_from_result(record)
+            await self._publish_record(record)
             return
 
-        record["status"] = _STATUS_SUCCEEDED
-        record["finished_at"] = _now_text()
-        record["message"] = "任务执行完成。"
-        record["result"] = result
+        record = {
+            **record,
+            "status": _STATUS_SUCCEEDED,
+            "finished_at": _now_text(),
+            "message": "任务执行完成。",
+            "result": result,
+            "error": None,
+        }
         self._sync_progress_from_result(record)
-        record["error"] = None
-        await self._persist_store()
+        await self._publish_record(record)
 
     async def _execute_job(self, record: dict[str, Any]) -> dict[str, Any]:
         job_type = str(record.get("job_type", "")).strip().lower()
@@ -337,7 +373,7 @@ class AsyncJobService:
                 "retry_of_job_id": str(item.get("retry_of_job_id", "")).strip(),
                 "progress": item.get("progress") if isinstance(item.get("progress"), dict) else None,
                 "result": item.get("result") if isinstance(item.get("result"), dict) else None,
-                "error": item.get("error") if isinstance(item.get("error"), dict) else None,
+                "error": _normalize_error_record(item.get("error")),
             }
         self._jobs_by_id = items
 
@@ -367,27 +403,35 @@ class AsyncJobService:
 
     async def _persist_store(self) -> None:
         async with self._write_lock:
-            payload = {
-                "jobs": sorted(
-                    self._jobs_by_id.values(),
-                    key=lambda item: (
-                        str(item.get("submitted_at", "")),
-                        str(item.get("job_id", "")),
-                    ),
-                )
-            }
-            with tempfile.NamedTemporaryFile(
-                "w",
-                encoding="utf-8",
-                dir=str(self._store_path.parent),
-                delete=False,
-            ) as fp:
-                json.dump(payload, fp, ensure_ascii=False, indent=2)
-                tmp_name = fp.name
-            Path(tmp_name).replace(self._store_path)
+            await self._write_jobs(self._jobs_by_id.values())
+
+    async def _publish_record(self, record: dict[str, Any]) -> None:
+        # Swap the record in only after the store is written, so a status poll never
+        # sees a state that is not yet on disk.
+        async with self._write_lock:
+            job_id = record["job_id"]
+            await self._write_jobs({**self._jobs_by_id, job_id: record}.values())
+            self._jobs_by_id[job_id] = record
+
+    async def _write_jobs(self, records: Iterable[dict[str, Any]]) -> None:
+        payload = {"jobs": sorted(records, key=_job_sort_key)}
+        # Serialize on the loop (records are replaced there); write off it.
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(self._write_store_text, text)
+
+    def _write_store_text(self, text: str) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=str(self._store_path.parent),
+            delete=False,
+        ) as fp:
+            fp.write(text)
+            tmp_name = fp.name
+        Path(tmp_name).replace(self._store_path)
 
     def _to_list_item(self, record: dict[str, Any]) -> AsyncJobListItem:
-        return AsyncJobListItem(
+        return AsyncJobListItem.model_construct(
             job_id=str(record.get("job_id", "")).strip(),
             job_type=str(record.get("job_type", "")).strip(),
             status=str(record.get("status", "")).strip(),
@@ -402,15 +446,13 @@ class AsyncJobService:
     def _to_status_data(self, record: dict[str, Any]) -> AsyncJobStatusData:
         error_raw = record.get("error")
         error = None
-        if isinstance(error_raw, dict):
-            error = AsyncJobErrorData(
-                code=str(error_raw.get("code", "")).strip(),
-                message=str(error_raw.get("message", "")).strip(),
-                details=error_raw.get("details")
-                if isinstance(error_raw.get("details"), dict) or error_raw.get("details") is None
-                else None,
+        if error_raw is not None:
+            error = AsyncJobErrorData.model_construct(
+                code=error_raw["code"],
+                message=error_raw["message"],
+                details=error_raw["details"],
             )
-        return AsyncJobStatusData(
+        return AsyncJobStatusData.model_construct(
             job_id=str(record.get("job_id", "")).strip(),
             job_type=str(record.get("job_type", "")).strip(),
             status=str(record.get("status", "")).strip(),
@@ -434,7 +476,7 @@ class AsyncJobService:
         total = self._coerce_progress_number(raw.get("total"))
         if current <= 0 and total <= 0:
             return None
-        return AsyncJobProgressData(current=current, total=total)
+        return AsyncJobProgressData.model_construct(current=current, total=total)
 
     def _sync_progress_from_result(self, record: dict[str, Any]) -> None:
         result = record.get("result")
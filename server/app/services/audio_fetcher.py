@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import subprocess
 import sys
 from pathlib import Path
 from shutil import which
@@ -11,32 +11,44 @@ from app.core.errors import AppError, ErrorCode
 
 logger = logging.getLogger(__name__)
 
-_AUDIO_SUFFIXES = {".wav", ".mp3", ".m4a", ".flac", ".opus", ".webm"}
+_AUDIO_SUFFIXES = frozenset(
+    {".wav", ".mp3", ".m4a", ".aac", ".flac", ".opus", ".ogg", ".webm"}
+)
+_OUTPUT_STEM = "source"
+# Only the tail of stderr is reported; a few KiB covers 500 chars of multi-byte text.
+_STDERR_TAIL_BYTES = 4096
 
 
 class AudioFetcher:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        # Resolved once per instance (settings are fixed for its lifetime); failures
+        # are not cached, so installing a missing tool takes effect on the next job.
+        self._yt_dlp_cmd: list[str] | None = None
+        self._ffmpeg_location: str | None = None
 
-    def fetch_audio(
+    async def fetch_audio_async(
         self,
         video_url: str,
         output_dir: Path,
         headers: dict[str, str] | None = None,
     ) -> Path:
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_template = output_dir / "source.%(ext)s"
-        yt_dlp_cmd = self._resolve_yt_dlp_command()
-        ffmpeg_location = self._resolve_ffmpeg_location()
+        output_template = output_dir / f"{_OUTPUT_STEM}.%(ext)s"
+        if self._yt_dlp_cmd is None:
+            self._yt_dlp_cmd = self._resolve_yt_dlp_command()
+        if self._ffmpeg_location is None:
+            self._ffmpeg_location = self._resolve_ffmpeg_location()
+        yt_dlp_cmd = self._yt_dlp_cmd
+        ffmpeg_location = self._ffmpeg_location
 
         cmd = [
             *yt_dlp_cmd,
             "--no-playlist",
+            "--no-progress",
+            # Keep the source codec: faster-whisper decodes compressed audio itself, so a
+            # PCM WAV transcode would only add a file ~10x larger to write and read back.
             "-x",
-            "--audio-format",
-            "wav",
-            "--audio-quality",
-            "0",
             "--ffmpeg-location",
             ffmpeg_location,
             "-o",
@@ -51,8 +63,13 @@ class AudioFetcher:
             cmd.extend(["--add-header", f"{header_key}:{header_value}"])
 
         logger.info("Start downloading audio for URL: %s", video_url)
+        # Awaiting the child process keeps a long download from pinning a worker thread.
         try:
-            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
         except FileNotFoundError as exc:
             raise AppError(
                 code=ErrorCode.DEPENDENCY_MISSING,
@@ -60,25 +77,48 @@ class AudioFetcher:
                 status_code=500,
                 details={"dependency": str(exc)},
             ) from exc
+        try:
+            stderr = await self._read_stderr_tail(proc)
+            await proc.wait()
+        except asyncio.CancelledError:
+            # Do not leave yt-dlp running when the job is cancelled.
+            proc.kill()
+            await proc.wait()
+            raise
 
         if proc.returncode != 0:
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
                 message="视频音频下载失败，请确认链接可访问。",
                 status_code=502,
-                details={"stderr": proc.stderr[-500:]},
+                details={"stderr": stderr.decode("utf-8", errors="replace")[-500:]},
             )
 
-        files = [p for p in output_dir.iterdir() if p.suffix.lower() in _AUDIO_SUFFIXES]
+        audio_path = self._find_downloaded_audio(output_dir)
+        logger.info("Downloaded audio file: %s", audio_path)
+        return audio_path
+
+    async def _read_stderr_tail(self, proc: asyncio.subprocess.Process) -> bytes:
+        # Drain stderr so yt-dlp never blocks on a full pipe, keeping only the tail.
+        tail = b""
+        if proc.stderr is None:
+            return tail
+        while chunk := await proc.stderr.read(65536):
+            tail = (tail + chunk)[-_STDERR_TAIL_BYTES:]
+        return tail
+
+    def _find_downloaded_audio(self, output_dir: Path) -> Path:
+        files = [
+            p for p in output_dir.glob(f"{_OUTPUT_STEM}.*") if p.suffix.lower() in _AUDIO_SUFFIXES
+        ]
         if not files:
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
                 message="音频下载完成但未找到音频文件。",
                 status_code=502,
             )
-
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        logger.info("Downloaded audio file: %s", files[0])
+        if len(files) > 1:
+            files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
         return files[0]
 
     def _resolve_yt_dlp_command(self) -> list[str]:
@@ -7,7 +7,6 @@ import shutil
 import time
 import uuid
 from pathlib import Path
-from urllib.parse import urlparse
 
 import httpx
 
@@ -22,15 +21,30 @@ from app.services.llm import LLMService
 logger = logging.getLogger(__name__)
 
 _VALID_HOSTS = {"www.bilibili.com", "bilibili.com", "b23.tv", "www.b23.tv"}
-_BVID_PATTERN = re.compile(r"(?i)^bv[0-9a-z]{10}$")
+_BVID_PATTERN = re.compile(r"bv[0-9a-z]{10}", re.IGNORECASE | re.ASCII)
+_BVID_LENGTH = 12
 _BVID_IN_TEXT_PATTERN = re.compile(r"(?i)(bv[0-9a-z]{10})")
+# Scheme plus netloc, mirroring urlparse(): the scheme is case-insensitive and the
+# netloc runs up to the first "/", "?" or "#".
+_URL_SCHEME_NETLOC_PATTERN = re.compile(r"(?i:https?)://([^/?#]*)", re.ASCII)
 _BILIBILI_VIEW_URL = "https://api.bilibili.com/x/web-interface/view"
 _BILIBILI_REPLY_URL = "https://api.bilibili.com/x/v2/reply/main"
+_LOCAL_FALLBACK_SUMMARY_TEMPLATE = (
+    "# B站视频总结（本地降级）\n\n"
+    "- 视频链接：{video_url}\n"
+    "- 转写字数：{chars}\n"
+    "- 降级原因：{reason}\n\n"
+    "## 摘要\n\n"
+    "LLM 上游调用失败，当前返回基于转写文本的本地降级结果。\n\n"
+    "## 转写片段\n\n"
+    "> {preview}\n"
+)
 
 
 def _normalize_bilibili_video_url(video_url: str) -> str:
     candidate = video_url.strip()
-    if _BVID_PATTERN.fullmatch(candidate):
+    # Full URLs are the common input; only a bare 12-char id can match.
+    if len(candidate) == _BVID_LENGTH and _BVID_PATTERN.fullmatch(candidate):
         return f"https://www.bilibili.com/video/BV{candidate[2:]}"
     return candidate
 
@@ -42,21 +56,24 @@ class BilibiliSummarizer:
         self._asr = ASRService(settings)
         self._llm = LLMService(settings)
         self._comment_insights = CommentInsightService(settings, llm_service=self._llm)
+        # Resolved once: resolve() touches the filesystem and settings are fixed here.
+        self._temp_root = resolve_runtime_path(settings.runtime.temp_dir)
 
     async def summarize(self, video_url: str) -> BilibiliSummaryData:
         normalized_video_url = _normalize_bilibili_video_url(video_url)
         self._validate_url(normalized_video_url)
 
         start = time.perf_counter()
-        base_temp = resolve_runtime_path(self._settings.runtime.temp_dir)
-        job_dir = base_temp / f"bili-{uuid.uuid4().hex}"
-        job_dir.mkdir(parents=True, exist_ok=True)
+        # The fetcher creates the directory when the download starts.
+        job_dir = self._temp_root / f"bili-{uuid.uuid4().hex[:12]}"
 
         try:
-            # Offload blocking download/ASR work to a worker thread, so /health
-            # and other requests remain responsive during long Bilibili jobs.
-            audio_path = await asyncio.to_thread(
-                self._fetcher.fetch_audio, normalized_video_url, job_dir
+            # The download is an awaited subprocess and ASR runs in a worker thread, so
+            # /health and other requests remain responsive during long Bilibili jobs.
+            # The ASR model loads while the audio downloads.
+            audio_path, _ = await asyncio.gather(
+                self._fetcher.fetch_audio_async(normalized_video_url, job_dir),
+                asyncio.to_thread(self._asr.prewarm),
             )
             transcript = await asyncio.to_thread(self._asr.transcribe, audio_path)
             try:
@@ -85,7 +102,7 @@ class BilibiliSummarizer:
 
         elapsed_ms = int((time.perf_counter() - start) * 1000)
         logger.info("Bilibili summarize done, elapsed_ms=%d", elapsed_ms)
-        return BilibiliSummaryData(
+        return BilibiliSummaryData.model_construct(
             video_url=normalized_video_url,
             summary_markdown=summary_md,
             elapsed_ms=elapsed_ms,
@@ -95,27 +112,22 @@ class BilibiliSummarizer:
     def _build_local_fallback_summary(
         self, *, video_url: str, transcript: str, reason: str
     ) -> str:
-        preview = transcript[:600].strip()
-        return (
-            "# B站视频总结（本地降级）\n\n"
-            f"- 视频链接：{video_url}\n"
-            f"- 转写字数：{len(transcript)}\n"
-            f"- 降级原因：{reason}\n\n"
-            "## 摘要\n\n"
-            "LLM 上游调用失败，当前返回基于转写文本的本地降级结果。\n\n"
-            "## 转写片段\n\n"
-            f"> {preview}\n"
+        return _LOCAL_FALLBACK_SUMMARY_TEMPLATE.format(
+            video_url=video_url,
+            chars=len(transcript),
+            reason=reason,
+            preview=transcript[:600].strip(),
         )
 
     def _validate_url(self, video_url: str) -> None:
-        parsed = urlparse(video_url)
-        if parsed.scheme not in {"http", "https"}:
+        match = _URL_SCHEME_NETLOC_PATTERN.match(video_url)
+        if match is None:
             raise AppError(
                 code=ErrorCode.INVALID_INPUT,
                 message="视频链接必须以 http:// 或 https:// 开头。",
                 status_code=400,
             )
-        if parsed.netloc not in _VALID_HOSTS:
+        if match.group(1) not in _VALID_HOSTS:
             raise AppError(
                 code=ErrorCode.INVALID_INPUT,
                 message="当前仅支持 bilibili.com 或 b23.tv 链接。",
@@ -35,6 +35,7 @@ class PeriodicDatabaseBackupService:
             return None
         repository = self._repository or NoteLibraryRepository(str(self._db_path))
         self._repository = repository
+        repository.optimize()
         backup_path = repository.backup_database(
             keep_latest_files=self._settings.runtime.backup.keep_latest_files
         )
@@ -68,7 +69,8 @@ class PeriodicDatabaseBackupService:
 
         while not stop_event.is_set():
             try:
-                self.run_once()
+                # The page copy and file writes are blocking; keep them off the event loop.
+                await asyncio.to_thread(self.run_once)
             except Exception:
                 logger.exception("Periodic database backup failed.")
             if not await self._sleep_or_stop(stop_event, interval_seconds):
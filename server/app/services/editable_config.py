@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import os
 import tempfile
 import threading
@@ -11,7 +12,11 @@ import yaml
 from app.core.config import Settings, clear_settings_cache, get_config_path, get_settings
 from app.core.errors import AppError, ErrorCode
 
-_EDITABLE_PATHS = {
+# libyaml's C loader/emitter when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_EDITABLE_PATHS: frozenset[str] = frozenset({
     "server.host",
     "server.port",
     "llm.enabled",
@@ -22,6 +27,9 @@ _EDITABLE_PATHS = {
     "asr.device",
     "asr.model_size",
     "asr.language",
+    "asr.compute_type",
+    "asr.cpu_threads",
+    "asr.batch_size",
     "bilibili.max_video_minutes",
     "bilibili.yt_dlp_path",
     "bilibili.ffmpeg_path",
@@ -62,7 +70,22 @@ _EDITABLE_PATHS = {
     "xiaohongshu.web_readonly.source_url_field",
     "xiaohongshu.web_readonly.max_images_per_note",
     "xiaohongshu.web_readonly.host_allowlist",
-}
+})
+
+
+def _build_editable_tree(paths: frozenset[str]) -> dict[str, Any]:
+    # Nested keys of the editable paths; leaves are None. Built in sorted path order.
+    tree: dict[str, Any] = {}
+    for path in sorted(paths):
+        *parents, leaf = path.split(".")
+        node = tree
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = None
+    return tree
+
+
+_EDITABLE_TREE = _build_editable_tree(_EDITABLE_PATHS)
 
 _CONFIG_WRITE_LOCK = threading.RLock()
 
@@ -78,10 +101,11 @@ class EditableConfigService:
             resolved = resolved.with_name("config.yaml")
         self._config_path = resolved
         self._default_path = default_path or self._config_path.with_name("config.example.yaml")
+        # path -> ((mtime_ns, size), parsed); reparsed only when the file changes.
+        self._yaml_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
     def get_editable_settings(self) -> dict[str, Any]:
-        current = get_settings().model_dump()
-        return self._extract_allowed(current)
+        return self._extract_from_settings(get_settings())
 
     def update_editable_settings(self, patch: dict[str, Any]) -> dict[str, Any]:
         if not isinstance(patch, dict) or not patch:
@@ -99,14 +123,6 @@ class EditableConfigService:
                 status_code=400,
             )
 
-        for path in flattened.keys():
-            if path not in _EDITABLE_PATHS:
-                raise AppError(
-                    code=ErrorCode.INVALID_INPUT,
-                    message=f"字段不可修改或不存在：{path}",
-                    status_code=400,
-                )
-
         with _CONFIG_WRITE_LOCK:
             raw = self._load_yaml(self._config_path)
             for path, value in flattened.items():
@@ -121,6 +137,9 @@ class EditableConfigService:
         with _CONFIG_WRITE_LOCK:
             raw = self._load_yaml(self._config_path)
             default_raw = self._load_defaults()
+            if self._extract_allowed(raw) == self._extract_allowed(default_raw):
+                # Already at defaults: skip the validate/write and the settings reload.
+                return self.get_editable_settings()
             for path in _EDITABLE_PATHS:
                 self._set_by_path(raw, path, self._get_by_path(default_raw, path))
 
@@ -135,32 +154,53 @@ class EditableConfigService:
         return Settings().model_dump()
 
     def _load_yaml(self, path: Path) -> dict[str, Any]:
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return {}
-        with path.open("r", encoding="utf-8") as fp:
-            loaded = yaml.safe_load(fp) or {}
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == file_key:
+            # Callers patch the returned dict in place, so hand out a copy.
+            return copy.deepcopy(cached[1])
+
+        loaded = yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
         if not isinstance(loaded, dict):
             raise AppError(
                 code=ErrorCode.INVALID_INPUT,
                 message=f"配置文件不是 YAML 对象：{path}",
                 status_code=400,
             )
-        return loaded
+        self._yaml_cache[path] = (file_key, loaded)
+        return copy.deepcopy(loaded)
 
     def _write_yaml(self, path: Path, payload: dict[str, Any]) -> None:
+        self._yaml_cache.pop(path, None)
+        # Emit the whole document first: the temp file then gets a single write, and an
+        # emitter error can no longer leave a half-written temp file behind.
+        data = yaml.dump(
+            payload,
+            Dumper=_YAML_DUMPER,
+            allow_unicode=True,
+            sort_keys=False,
+            default_flow_style=False,
+            # Long values (request bodies, URL templates) stay on one line instead of
+            # being folded at 80 columns.
+            width=2**20,
+            encoding="utf-8",
+        )
         path.parent.mkdir(parents=True, exist_ok=True)
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
+                mode="wb",
                 dir=path.parent,
                 prefix=f".{path.name}.",
                 suffix=".tmp",
                 delete=False,
             ) as fp:
-                yaml.safe_dump(payload, fp, allow_unicode=True, sort_keys=False)
                 temp_path = Path(fp.name)
+                fp.write(data)
             os.replace(str(temp_path), str(path))
         finally:
             if temp_path is not None and temp_path.exists():
@@ -176,22 +216,30 @@ class EditableConfigService:
                 status_code=400,
             ) from exc
 
-    def _flatten_patch(
-        self,
-        payload: dict[str, Any],
-        *,
-        prefix: str = "",
-    ) -> dict[str, Any]:
+    def _flatten_patch(self, payload: dict[str, Any]) -> dict[str, Any]:
+        # Depth-first with a stack of item iterators: same key order as recursion,
+        # without a call frame and a throwaway dict per nested level. Leaves are
+        # checked against the editable paths as they are reached.
         flattened: dict[str, Any] = {}
-        for key, value in payload.items():
-            if not isinstance(key, str) or not key.strip():
-                continue
-            full_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                nested = self._flatten_patch(value, prefix=full_key)
-                flattened.update(nested)
-            else:
+        stack = [("", iter(payload.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if not isinstance(key, str) or not key.strip():
+                    continue
+                full_key = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, dict):
+                    stack.append((full_key, iter(value.items())))
+                    break
+                if full_key not in _EDITABLE_PATHS:
+                    raise AppError(
+                        code=ErrorCode.INVALID_INPUT,
+                        message=f"字段不可修改或不存在：{full_key}",
+                        status_code=400,
+                    )
                 flattened[full_key] = value
+            else:
+                stack.pop()
         return flattened
 
     def _set_by_path(self, payload: dict[str, Any], path: str, value: Any) -> None:
@@ -215,8 +263,34 @@ class EditableConfigService:
                 return None
         return current
 
-    def _extract_allowed(self, payload: dict[str, Any]) -> dict[str, Any]:
+    def _extract_from_settings(
+        self,
+        model: Any,
+        tree: dict[str, Any] = _EDITABLE_TREE,
+    ) -> dict[str, Any]:
+        # Reads the editable fields straight off the cached Settings instead of
+        # model_dump()-ing every section. Containers are copied so callers cannot
+        # mutate the shared Settings.
+        result: dict[str, Any] = {}
+        for key, subtree in tree.items():
+            value = getattr(model, key, None)
+            if subtree is not None:
+                result[key] = self._extract_from_settings(value, subtree)
+            elif isinstance(value, (list, dict)):
+                result[key] = copy.deepcopy(value)
+            else:
+                result[key] = value
+        return result
+
+    def _extract_allowed(
+        self,
+        payload: Any,
+        tree: dict[str, Any] = _EDITABLE_TREE,
+    ) -> dict[str, Any]:
+        # One walk over the precomputed tree; shared prefixes are looked up once.
+        source = payload if isinstance(payload, dict) else {}
         result: dict[str, Any] = {}
-        for path in sorted(_EDITABLE_PATHS):
-            self._set_by_path(result, path, self._get_by_path(payload, path))
+        for key, subtree in tree.items():
+            value = source.get(key)
+            result[key] = value if subtree is None else self._extract_allowed(value, subtree)
         return result
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import math
@@ -7,6 +8,7 @@ import re
 from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import Settings
 from app.core.errors import AppError, ErrorCode
@@ -14,6 +16,26 @@ from app.services.asset_categories import ASSET_CATEGORY_KEYS, ASSET_CATEGORY_SP
 
 logger = logging.getLogger(__name__)
 
+# Upstream statuses with a dedicated error; other 4xx/5xx map to UPSTREAM_ERROR.
+_LLM_STATUS_ERRORS: dict[int, tuple[ErrorCode, str, int]] = {
+    401: (ErrorCode.AUTH_EXPIRED, "LLM 鉴权失败，请检查 API Key。", 401),
+    403: (ErrorCode.AUTH_EXPIRED, "LLM 鉴权失败，请检查 API Key。", 401),
+    429: (ErrorCode.RATE_LIMITED, "LLM 请求触发限流，请稍后重试。", 429),
+}
+
+# Pooled client owned by the app lifespan (app.state.llm_client): consecutive summaries
+# reuse its keep-alive connections instead of paying a TCP+TLS handshake per call.
+# Without one (tests, CLI tools) each request opens and closes its own client.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def set_shared_client(client: httpx.AsyncClient | None) -> httpx.AsyncClient | None:
+    # Returns the previous client so a nested lifespan can restore it on exit.
+    global _shared_client
+    previous, _shared_client = _shared_client, client
+    return previous
+
+
 _SYSTEM_PROMPT = (
     "你是一个中文知识整理助手。"
     "请把输入转写整理成结构化 Markdown。"
@@ -112,13 +134,21 @@ def estimate_finance_news_digest_prompt_chars(
 class LLMService:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        # Settings are fixed for the service's lifetime (services are rebuilt on
+        # config reload), so the endpoint and auth headers are built once.
+        llm_cfg = settings.llm
+        self._chat_url = f"{llm_cfg.api_base.rstrip('/')}/chat/completions"
+        self._timeout_seconds = llm_cfg.timeout_seconds
+        self._auth_headers: dict[str, str] | None = None
+        if llm_cfg.api_key:
+            self._auth_headers = {
+                "Authorization": f"Bearer {llm_cfg.api_key}",
+                "Content-Type": "application/json",
+            }
 
     def _normalize_image_urls(self, image_urls: list[str] | None) -> list[str]:
-        return [
-            item.strip()
-            for item in (image_urls or [])
-            if isinstance(item, str) and item.strip().startswith(("http://", "https://"))
-        ]
+        stripped = (item.strip() for item in (image_urls or []) if isinstance(item, str))
+        return [url for url in stripped if url.startswith(("http://", "https://"))]
 
     def _build_multimodal_user_content(
         self,
@@ -132,39 +162,42 @@ class LLMService:
             )
         return user_content
 
-    def _chat_completions_url(self) -> str:
-        return f"{self._settings.llm.api_base.rstrip('/')}/chat/completions"
-
-    def _require_api_key(self) -> str:
-        api_key = self._settings.llm.api_key
-        if api_key:
-            return api_key
+    def _require_auth_headers(self) -> dict[str, str]:
+        if self._auth_headers is not None:
+            return self._auth_headers
         raise AppError(
             code=ErrorCode.INVALID_INPUT,
             message="LLM 已启用但缺少 api_key 配置。",
             status_code=400,
         )
 
-    def _build_auth_headers(self, api_key: str) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
     async def _request_chat_completion(
         self,
         payload: dict[str, Any],
         *,
-        api_key: str,
+        headers: dict[str, str],
         server_error_message: str | None = None,
     ) -> str:
-        url = self._chat_completions_url()
-        headers = self._build_auth_headers(api_key)
+        shared = _shared_client
+        client_cm = contextlib.nullcontext(shared) if shared is not None else httpx.AsyncClient()
         try:
-            async with httpx.AsyncClient(
-                timeout=self._settings.llm.timeout_seconds
-            ) as client:
-                resp = await client.post(url, headers=headers, json=payload)
+            async with client_cm as client, client.stream(
+                "POST",
+                self._chat_url,
+                headers=headers,
+                # Prompts carry whole transcripts; orjson encodes them straight to
+                # UTF-8 bytes (Content-Type is in the auth headers).
+                content=orjson.dumps({**payload, "stream": True}),
+                timeout=self._timeout_seconds,
+            ) as resp:
+                self._raise_for_llm_status(resp.status_code, server_error_message)
+                if resp.headers.get("content-type", "").startswith("text/event-stream"):
+                    result = await self._read_streamed_text(resp)
+                else:
+                    # Upstreams that ignore "stream" answer with one JSON body.
+                    result = self._extract_response_text(
+                        self._decode_json_body(await resp.aread())
+                    )
         except httpx.HTTPError as exc:
             logger.warning("LLM upstream request failed: %s", repr(exc))
             raise AppError(
@@ -173,40 +206,82 @@ class LLMService:
                 status_code=502,
             ) from exc
 
-        if resp.status_code in {401, 403}:
-            raise AppError(
-                code=ErrorCode.AUTH_EXPIRED,
-                message="LLM 鉴权失败，请检查 API Key。",
-                status_code=401,
-            )
-        if resp.status_code == 429:
-            raise AppError(
-                code=ErrorCode.RATE_LIMITED,
-                message="LLM 请求触发限流，请稍后重试。",
-                status_code=429,
-            )
-        if server_error_message and resp.status_code >= 500:
+        if not result:
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
-                message=server_error_message,
+                message="LLM 未返回有效内容。",
                 status_code=502,
             )
-        if resp.status_code >= 400:
+        return result
+
+    def _raise_for_llm_status(self, status: int, server_error_message: str | None) -> None:
+        if status < 400:
+            return
+        mapped = _LLM_STATUS_ERRORS.get(status)
+        if mapped is not None:
+            code, message, http_status = mapped
+            raise AppError(code=code, message=message, status_code=http_status)
+        if server_error_message and status >= 500:
+            message = server_error_message
+        else:
+            message = f"LLM 请求失败（HTTP {status}）。"
+        raise AppError(code=ErrorCode.UPSTREAM_ERROR, message=message, status_code=502)
+
+    def _decode_json_body(self, body: bytes | str) -> Any:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
-                message=f"LLM 请求失败（HTTP {resp.status_code}）。",
+                message="LLM 返回内容不是有效 JSON。",
                 status_code=502,
-            )
+            ) from exc
 
-        raw = resp.json()
-        result = self._extract_response_text(raw)
-        if not result:
+    async def _read_streamed_text(self, resp: httpx.Response) -> str:
+        # Server-sent chunks of an OpenAI-compatible stream: only the delta text is
+        # kept, so the full response object is never materialized. A stream must end
+        # with [DONE] or a finish_reason; anything else is treated as broken.
+        parts: list[str] = []
+        finished = False
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                finished = True
+                break
+            chunk = self._decode_json_body(data)
+            if not isinstance(chunk, dict) or "error" in chunk:
+                raise AppError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message="LLM 流式响应中途出错。",
+                    status_code=502,
+                )
+            choices = chunk.get("choices")
+            if choices == []:
+                # Usage-only chunks carry an empty choices list.
+                continue
+            try:
+                choice = choices[0]
+                delta = choice["delta"]
+                content = delta.get("content")
+            except (KeyError, IndexError, TypeError, AttributeError) as exc:
+                raise AppError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message="LLM 响应结构异常。",
+                    status_code=502,
+                ) from exc
+            if isinstance(content, str):
+                parts.append(content)
+            if choice.get("finish_reason") is not None:
+                finished = True
+        if not finished:
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
-                message="LLM 未返回有效内容。",
+                message="LLM 流式响应未完整结束。",
                 status_code=502,
             )
-        return result
+        return "".join(parts).strip()
 
     async def summarize(self, transcript: str, video_url: str) -> str:
         if not self._settings.llm.enabled:
@@ -222,7 +297,7 @@ class LLMService:
                 f"> {preview}\n"
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         payload = {
             "model": self._settings.llm.model,
             "temperature": 0.2,
@@ -237,7 +312,7 @@ class LLMService:
         logger.info("Request LLM summarize, model=%s", self._settings.llm.model)
         return await self._request_chat_completion(
             payload,
-            api_key=api_key,
+            headers=headers,
             server_error_message="LLM 上游服务异常。",
         )
 
@@ -271,7 +346,7 @@ class LLMService:
                 f"{image_section}"
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         user_text = (
             f"笔记ID: {note_id}\n"
             f"标题: {title}\n"
@@ -295,7 +370,7 @@ class LLMService:
                 },
             ],
         }
-        return await self._request_chat_completion(payload, api_key=api_key)
+        return await self._request_chat_completion(payload, headers=headers)
 
     async def summarize_xiaohongshu_video_note(
         self,
@@ -329,7 +404,7 @@ class LLMService:
                 f"> {preview}\n"
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         user_text = (
             f"笔记ID: {note_id}\n"
             f"标题: {title}\n"
@@ -354,7 +429,7 @@ class LLMService:
                 },
             ],
         }
-        return await self._request_chat_completion(payload, api_key=api_key)
+        return await self._request_chat_completion(payload, headers=headers)
 
     async def summarize_comment_insights(
         self,
@@ -418,7 +493,7 @@ class LLMService:
                 "- 已按点赞数排序提炼。\n"
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         comment_lines = "\n".join(
             f"{index + 1}. 👍{int(item['like_count'])} | {str(item['text'])}"
             for index, item in enumerate(normalized_comments)
@@ -442,7 +517,7 @@ class LLMService:
         }
         return await self._request_chat_completion(
             payload,
-            api_key=api_key,
+            headers=headers,
             server_error_message="LLM 评论洞察生成失败。",
         )
 
@@ -472,7 +547,7 @@ class LLMService:
         if not self._settings.llm.enabled:
             return {key: 0.0 for key in ASSET_CATEGORY_KEYS}
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         category_lines = "\n".join(
             f"- {key}: {label}" for key, label in ASSET_CATEGORY_SPECS
         )
@@ -504,7 +579,7 @@ class LLMService:
         }
         raw = await self._request_chat_completion(
             payload,
-            api_key=api_key,
+            headers=headers,
             server_error_message="LLM 资产图片识别失败。",
         )
         return self._parse_asset_amounts_response(raw)
@@ -531,7 +606,7 @@ class LLMService:
                 second_ref=second_ref,
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         first_trimmed = first_content.strip()[:6000]
         second_trimmed = second_content.strip()[:6000]
         heading_template = self._extract_h2_headings(first_trimmed)
@@ -559,7 +634,7 @@ class LLMService:
         }
         result = await self._request_chat_completion(
             payload,
-            api_key=api_key,
+            headers=headers,
             server_error_message="LLM 合并生成失败。",
         )
         fallback_title = (first_title.strip() or second_title.strip() or "合并笔记")[:22]
@@ -647,7 +722,7 @@ class LLMService:
                 "- 继续观察后续新增报道。\n"
             )
 
-        api_key = self._require_api_key()
+        headers = self._require_auth_headers()
         payload = {
             "model": self._settings.llm.model,
             "temperature": 0.2,
@@ -664,7 +739,7 @@ class LLMService:
         }
         return await self._request_chat_completion(
             payload,
-            api_key=api_key,
+            headers=headers,
             server_error_message="LLM 24小时新闻摘要生成失败。",
         )
 
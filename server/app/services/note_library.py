@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
 import uuid
@@ -9,6 +9,8 @@ from difflib import SequenceMatcher
 from itertools import combinations
 from typing import Any
 
+import orjson
+
 from app.core.config import Settings, resolve_runtime_path
 from app.core.errors import AppError, ErrorCode
 from app.models.schemas import (
@@ -167,29 +169,30 @@ class NoteLibraryService:
             summary_markdown=summary_markdown,
             video_url=video_url,
         )
-        self._repository.save_bilibili_note(
-            note_id=note_id,
-            title=normalized_title,
-            video_url=video_url,
-            summary_markdown=summary_markdown,
-            elapsed_ms=elapsed_ms,
-            transcript_chars=transcript_chars,
-        )
-        self._repository.upsert_source_index_links(
-            platform=_MERGE_SOURCE_BILIBILI,
-            mappings={
-                note_id: {
-                    "canonical_note_id": note_id,
-                    "merge_id": "",
-                    "state": _SOURCE_INDEX_STATE_ACTIVE,
-                }
-            },
-        )
+        with self._repository.write_batch():
+            self._repository.save_bilibili_note(
+                note_id=note_id,
+                title=normalized_title,
+                video_url=video_url,
+                summary_markdown=summary_markdown,
+                elapsed_ms=elapsed_ms,
+                transcript_chars=transcript_chars,
+            )
+            self._repository.upsert_source_index_links(
+                platform=_MERGE_SOURCE_BILIBILI,
+                mappings={
+                    note_id: {
+                        "canonical_note_id": note_id,
+                        "merge_id": "",
+                        "state": _SOURCE_INDEX_STATE_ACTIVE,
+                    }
+                },
+            )
         self._backup_database_after_note_save()
         items = self._repository.list_bilibili_notes()
         for item in items:
             if item["note_id"] == note_id:
-                return BilibiliSavedNote(**item)
+                return BilibiliSavedNote.model_construct(**item)
         return BilibiliSavedNote(
             note_id=note_id,
             title=normalized_title,
@@ -200,9 +203,32 @@ class NoteLibraryService:
             saved_at="",
         )
 
-    def list_bilibili_notes(self) -> BilibiliSavedNotesData:
-        items = [BilibiliSavedNote(**item) for item in self._repository.list_bilibili_notes()]
-        return BilibiliSavedNotesData(total=len(items), items=items)
+    def list_bilibili_notes(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str = "",
+    ) -> BilibiliSavedNotesData:
+        cursor_value = cursor.strip()
+        if cursor_value and not self._repository.get_bilibili_notes_by_ids([cursor_value]):
+            raise AppError(
+                code=ErrorCode.INVALID_INPUT,
+                message=f"分页游标 cursor={cursor_value} 对应的笔记不存在，请从第一页重新加载。",
+                status_code=400,
+            )
+        # Rows come from our own schema, so skip re-validating them.
+        items = [
+            BilibiliSavedNote.model_construct(**item)
+            for item in self._repository.list_bilibili_notes(
+                limit=limit,
+                after_note_id=cursor_value,
+            )
+        ]
+        return BilibiliSavedNotesData.model_construct(
+            total=len(items),
+            items=items,
+            next_cursor=self._next_page_cursor(items, limit),
+        )
 
     def delete_bilibili_note(self, note_id: str) -> int:
         return self._repository.delete_bilibili_note(note_id)
@@ -220,29 +246,59 @@ class NoteLibraryService:
             }
             for item in notes
         ]
-        saved_count = self._repository.save_xiaohongshu_notes(payload)
-        if saved_count > 0:
-            mappings = {
-                item["note_id"]: {
-                    "canonical_note_id": item["note_id"],
-                    "merge_id": "",
-                    "state": _SOURCE_INDEX_STATE_ACTIVE,
-                }
-                for item in payload
+        if not payload:
+            return 0
+        mappings = {
+            item["note_id"]: {
+                "canonical_note_id": item["note_id"],
+                "merge_id": "",
+                "state": _SOURCE_INDEX_STATE_ACTIVE,
             }
+            for item in payload
+        }
+        with self._repository.write_batch():
+            saved_count = self._repository.save_xiaohongshu_notes(payload)
             self._repository.upsert_source_index_links(
                 platform=_MERGE_SOURCE_XIAOHONGSHU,
                 mappings=mappings,
             )
-            self._backup_database_after_note_save()
+        self._backup_database_after_note_save()
         return saved_count
 
-    def list_xiaohongshu_notes(self) -> XiaohongshuSavedNotesData:
+    def list_xiaohongshu_notes(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str = "",
+    ) -> XiaohongshuSavedNotesData:
+        cursor_value = cursor.strip()
+        if cursor_value and not self._repository.get_xiaohongshu_notes_by_ids([cursor_value]):
+            raise AppError(
+                code=ErrorCode.INVALID_INPUT,
+                message=f"分页游标 cursor={cursor_value} 对应的笔记不存在，请从第一页重新加载。",
+                status_code=400,
+            )
         items = [
-            XiaohongshuSavedNote(**item)
-            for item in self._repository.list_xiaohongshu_notes()
+            XiaohongshuSavedNote.model_construct(**item)
+            for item in self._repository.list_xiaohongshu_notes(
+                limit=limit,
+                after_note_id=cursor_value,
+            )
         ]
-        return XiaohongshuSavedNotesData(total=len(items), items=items)
+        return XiaohongshuSavedNotesData.model_construct(
+            total=len(items),
+            items=items,
+            next_cursor=self._next_page_cursor(items, limit),
+        )
+
+    def _next_page_cursor(
+        self,
+        items: list[BilibiliSavedNote] | list[XiaohongshuSavedNote],
+        limit: int | None,
+    ) -> str:
+        if limit is None or len(items) < limit:
+            return ""
+        return items[-1].note_id
 
     def search_notes(
         self,
@@ -523,12 +579,12 @@ class NoteLibraryService:
                     relation_level=relation_level,
                     reason_codes=score_data["reason_codes"],
                     notes=[
-                        NotesMergeCandidateNote(
+                        NotesMergeCandidateNote.model_construct(
                             note_id=first["note_id"],
                             title=first["title"],
                             saved_at=first.get("saved_at", ""),
                         ),
-                        NotesMergeCandidateNote(
+                        NotesMergeCandidateNote.model_construct(
                             note_id=second["note_id"],
                             title=second["title"],
                             saved_at=second.get("saved_at", ""),
@@ -625,71 +681,72 @@ class NoteLibraryService:
             lineage_sources=lineage_sources,
         )
 
-        if preview.source == _MERGE_SOURCE_BILIBILI:
-            primary = notes[0]
-            elapsed_ms = int(primary.get("elapsed_ms", 0))
-            transcript_chars = int(primary.get("transcript_chars", 0))
-            for item in notes[1:]:
-                elapsed_ms += int(item.get("elapsed_ms", 0))
-                transcript_chars += int(item.get("transcript_chars", 0))
-            self._repository.save_bilibili_note(
-                note_id=merged_note_id,
-                title=final_title[:200],
-                video_url=str(primary.get("video_url", "")),
-                summary_markdown=final_summary,
-                elapsed_ms=elapsed_ms,
-                transcript_chars=transcript_chars,
-            )
-        else:
-            primary = notes[0]
-            self._repository.save_xiaohongshu_notes(
-                [
-                    {
-                        "note_id": merged_note_id,
-                        "title": final_title[:200],
-                        "source_url": str(primary.get("source_url", "")),
-                        "summary_markdown": final_summary,
-                    }
-                ]
-            )
-        pending_mappings = {
-            source_note_id: {
+        with self._repository.write_batch():
+            if preview.source == _MERGE_SOURCE_BILIBILI:
+                primary = notes[0]
+                elapsed_ms = int(primary.get("elapsed_ms", 0))
+                transcript_chars = int(primary.get("transcript_chars", 0))
+                for item in notes[1:]:
+                    elapsed_ms += int(item.get("elapsed_ms", 0))
+                    transcript_chars += int(item.get("transcript_chars", 0))
+                self._repository.save_bilibili_note(
+                    note_id=merged_note_id,
+                    title=final_title[:200],
+                    video_url=str(primary.get("video_url", "")),
+                    summary_markdown=final_summary,
+                    elapsed_ms=elapsed_ms,
+                    transcript_chars=transcript_chars,
+                )
+            else:
+                primary = notes[0]
+                self._repository.save_xiaohongshu_notes(
+                    [
+                        {
+                            "note_id": merged_note_id,
+                            "title": final_title[:200],
+                            "source_url": str(primary.get("source_url", "")),
+                            "summary_markdown": final_summary,
+                        }
+                    ]
+                )
+            pending_mappings = {
+                source_note_id: {
+                    "canonical_note_id": merged_note_id,
+                    "merge_id": merge_id,
+                    "state": _MERGE_STATUS_PENDING_CONFIRM,
+                }
+                for source_note_id in lineage_source_ids
+            }
+            pending_mappings[merged_note_id] = {
                 "canonical_note_id": merged_note_id,
                 "merge_id": merge_id,
                 "state": _MERGE_STATUS_PENDING_CONFIRM,
             }
-            for source_note_id in lineage_source_ids
-        }
-        pending_mappings[merged_note_id] = {
-            "canonical_note_id": merged_note_id,
-            "merge_id": merge_id,
-            "state": _MERGE_STATUS_PENDING_CONFIRM,
-        }
-        self._repository.upsert_source_index_links(
-            platform=preview.source,
-            mappings=pending_mappings,
-        )
+            self._repository.upsert_source_index_links(
+                platform=preview.source,
+                mappings=pending_mappings,
+            )
 
-        field_decisions = {
-            "merged_title": final_title,
-            "merged_summary_markdown": final_summary,
-            "source_refs": preview.source_refs,
-            "source_ref_by_note_id": lineage_source_refs,
-            "conflict_markers": preview.conflict_markers,
-            "lineage_source_ids": lineage_source_ids,
-            "lineage_sources": lineage_sources,
-            "source_link_snapshot": normalized_snapshot,
-        }
-        self._repository.save_merge_history(
-            merge_id=merge_id,
-            source=preview.source,
-            status=_MERGE_STATUS_PENDING_CONFIRM,
-            source_note_ids=preview.note_ids,
-            merged_note_id=merged_note_id,
-            field_decisions=field_decisions,
-            operator="user",
-        )
-        self._backup_database_after_note_save()
+            field_decisions = {
+                "merged_title": final_title,
+                "merged_summary_markdown": final_summary,
+                "source_refs": preview.source_refs,
+                "source_ref_by_note_id": lineage_source_refs,
+                "conflict_markers": preview.conflict_markers,
+                "lineage_source_ids": lineage_source_ids,
+                "lineage_sources": lineage_sources,
+                "source_link_snapshot": normalized_snapshot,
+            }
+            self._repository.save_merge_history(
+                merge_id=merge_id,
+                source=preview.source,
+                status=_MERGE_STATUS_PENDING_CONFIRM,
+                source_note_ids=preview.note_ids,
+                merged_note_id=merged_note_id,
+                field_decisions=field_decisions,
+                operator="user",
+            )
+        await asyncio.to_thread(self._backup_database_after_note_save)
         return NotesMergeCommitData(
             merge_id=merge_id,
             status=_MERGE_STATUS_PENDING_CONFIRM,
@@ -723,42 +780,43 @@ class NoteLibraryService:
             history=history,
             lineage_source_ids=lineage_source_ids,
         )
-        if source == _MERGE_SOURCE_BILIBILI:
-            deleted_merged_count = self._repository.delete_bilibili_note(merged_note_id)
-        else:
-            deleted_merged_count = self._repository.delete_xiaohongshu_note(merged_note_id)
-        rollback_mappings = {
-            source_note_id: {
-                "canonical_note_id": source_link_snapshot.get(source_note_id, source_note_id),
+        with self._repository.write_batch():
+            if source == _MERGE_SOURCE_BILIBILI:
+                deleted_merged_count = self._repository.delete_bilibili_note(merged_note_id)
+            else:
+                deleted_merged_count = self._repository.delete_xiaohongshu_note(merged_note_id)
+            rollback_mappings = {
+                source_note_id: {
+                    "canonical_note_id": source_link_snapshot.get(source_note_id, source_note_id),
+                    "merge_id": "",
+                    "state": _SOURCE_INDEX_STATE_ACTIVE,
+                }
+                for source_note_id in lineage_source_ids
+            }
+            rollback_mappings[merged_note_id] = {
+                "canonical_note_id": merged_note_id,
                 "merge_id": "",
-                "state": _SOURCE_INDEX_STATE_ACTIVE,
+                "state": _MERGE_STATUS_ROLLED_BACK,
             }
-            for source_note_id in lineage_source_ids
-        }
-        rollback_mappings[merged_note_id] = {
-            "canonical_note_id": merged_note_id,
-            "merge_id": "",
-            "state": _MERGE_STATUS_ROLLED_BACK,
-        }
-        self._repository.upsert_source_index_links(
-            platform=source,
-            mappings=rollback_mappings,
-        )
+            self._repository.upsert_source_index_links(
+                platform=source,
+                mappings=rollback_mappings,
+            )
 
-        self._repository.update_merge_history_status(
-            merge_id=merge_id,
-            status=_MERGE_STATUS_ROLLED_BACK,
-        )
-        self._repository.save_merge_history(
-            merge_id=f"rollback_{uuid.uuid4().hex}",
-            source=source,
-            status=_MERGE_STATUS_ROLLED_BACK,
-            source_note_ids=source_note_ids,
-            merged_note_id=merged_note_id,
-            field_decisions={},
-            rollback_of=merge_id,
-            operator="user",
-        )
+            self._repository.update_merge_history_status(
+                merge_id=merge_id,
+                status=_MERGE_STATUS_ROLLED_BACK,
+            )
+            self._repository.save_merge_history(
+                merge_id=f"rollback_{uuid.uuid4().hex}",
+                source=source,
+                status=_MERGE_STATUS_ROLLED_BACK,
+                source_note_ids=source_note_ids,
+                merged_note_id=merged_note_id,
+                field_decisions={},
+                rollback_of=merge_id,
+                operator="user",
+            )
         self._backup_database_after_note_save()
         return NotesMergeRollbackData(
             merge_id=merge_id,
@@ -797,33 +855,34 @@ class NoteLibraryService:
         source_note_ids = self._decode_json_note_ids(history["source_note_ids"])
         merged_note_id = str(history["merged_note_id"])
         lineage_source_ids = self._read_lineage_source_ids(history)
-        deleted_source_count = 0
-        if source == _MERGE_SOURCE_BILIBILI:
-            deleted_source_count = self._repository.delete_bilibili_notes(source_note_ids)
-        else:
-            deleted_source_count = self._repository.delete_xiaohongshu_notes(source_note_ids)
-        finalized_mappings = {
-            source_note_id: {
+        with self._repository.write_batch():
+            deleted_source_count = 0
+            if source == _MERGE_SOURCE_BILIBILI:
+                deleted_source_count = self._repository.delete_bilibili_notes(source_note_ids)
+            else:
+                deleted_source_count = self._repository.delete_xiaohongshu_notes(source_note_ids)
+            finalized_mappings = {
+                source_note_id: {
+                    "canonical_note_id": merged_note_id,
+                    "merge_id": merge_id,
+                    "state": _MERGE_STATUS_FINALIZED_DESTRUCTIVE,
+                }
+                for source_note_id in lineage_source_ids
+            }
+            finalized_mappings[merged_note_id] = {
                 "canonical_note_id": merged_note_id,
-                "merge_id": merge_id,
-                "state": _MERGE_STATUS_FINALIZED_DESTRUCTIVE,
+                "merge_id": "",
+                "state": _SOURCE_INDEX_STATE_ACTIVE,
             }
-            for source_note_id in lineage_source_ids
-        }
-        finalized_mappings[merged_note_id] = {
-            "canonical_note_id": merged_note_id,
-            "merge_id": "",
-            "state": _SOURCE_INDEX_STATE_ACTIVE,
-        }
-        self._repository.upsert_source_index_links(
-            platform=source,
-            mappings=finalized_mappings,
-        )
+            self._repository.upsert_source_index_links(
+                platform=source,
+                mappings=finalized_mappings,
+            )
 
-        self._repository.update_merge_history_status(
-            merge_id=merge_id,
-            status=_MERGE_STATUS_FINALIZED_DESTRUCTIVE,
-        )
+            self._repository.update_merge_history_status(
+                merge_id=merge_id,
+                status=_MERGE_STATUS_FINALIZED_DESTRUCTIVE,
+            )
         self._backup_database_after_note_save()
         return NotesMergeFinalizeData(
             merge_id=merge_id,
@@ -1501,7 +1560,7 @@ class NoteLibraryService:
         if not raw.strip():
             return []
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
         except ValueError:
             return []
         if not isinstance(parsed, list):
@@ -1516,7 +1575,7 @@ class NoteLibraryService:
         if not raw.strip():
             return {}
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
         except ValueError:
             return {}
         if not isinstance(parsed, dict):
@@ -2936,13 +2936,13 @@ class XiaohongshuService:
                     existing["summary_markdown"],
                     note.source_url,
                 )
-                return XiaohongshuSummaryItem(
+                return XiaohongshuSummaryItem.model_construct(
                     note_id=note.note_id,
                     title=existing["title"] or note.title,
                     source_url=note.source_url,
                     summary_markdown=summary_text,
                 )
-            return XiaohongshuSummaryItem(
+            return XiaohongshuSummaryItem.model_construct(
                 note_id=note.note_id,
                 title=note.title,
                 source_url=note.source_url,
@@ -2970,7 +2970,7 @@ class XiaohongshuService:
             note=note,
             summary_markdown=summary,
         )
-        result = XiaohongshuSummaryItem(
+        result = XiaohongshuSummaryItem.model_construct(
             note_id=note.note_id,
             title=note.title,
             source_url=note.source_url,
@@ -3073,11 +3073,10 @@ class XiaohongshuService:
 
         headers = self._build_video_download_headers(note.source_url)
         try:
-            audio_path = await asyncio.to_thread(
-                self._audio_fetcher.fetch_audio,
-                note.source_url,
-                job_dir,
-                headers,
+            # The ASR model loads while the audio downloads.
+            audio_path, _ = await asyncio.gather(
+                self._audio_fetcher.fetch_audio_async(note.source_url, job_dir, headers),
+                asyncio.to_thread(self._asr_service.prewarm),
             )
             transcript = await asyncio.to_thread(self._asr_service.transcribe, audio_path)
             return transcript.strip()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import shutil
@@ -7,14 +8,10 @@ from pathlib import Path
 
 import app.api.routes as routes_module
 import app.middleware.access_token as access_token_module
+import httpx
 from fastapi.testclient import TestClient
 
-from app.api.routes import (
-    _get_editable_config_service,
-    _get_finance_signals_service,
-    _get_note_library_service,
-    _get_xiaohongshu_service,
-)
+from app.api.routes import _get_xiaohongshu_service
 from app.core.config import get_settings, resolve_runtime_path
 from app.main import app
 from app.models.schemas import (
@@ -61,14 +58,10 @@ def _timestamped_backup_files() -> list[Path]:
 
 
 def _reset_xiaohongshu_state() -> None:
-    _get_editable_config_service.cache_clear()
-    _get_finance_signals_service.cache_clear()
-    _get_note_library_service.cache_clear()
-    _get_xiaohongshu_service.cache_clear()
-    get_settings.cache_clear()
+    routes_module._reload_runtime_services()
     db_path = _notes_db_path()
-    if db_path.exists():
-        db_path.unlink()
+    for suffix in ("", "-wal", "-shm"):
+        db_path.with_name(f"{db_path.name}{suffix}").unlink(missing_ok=True)
     backup_dir = _notes_backup_dir()
     if backup_dir.exists():
         shutil.rmtree(backup_dir)
@@ -84,6 +77,87 @@ def test_health_ok() -> None:
     assert body["request_id"]
 
 
+def test_health_echoes_escaped_request_id() -> None:
+    resp = client.get("/health", headers={"X-Request-ID": 'rid-"1"'})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.headers["X-Request-ID"] == 'rid-"1"'
+    body = resp.json()
+    assert body["request_id"] == 'rid-"1"'
+    assert body["data"] == {"status": "ok"}
+
+
+def test_request_id_is_generated_when_header_missing() -> None:
+    resp = client.post(
+        "/api/bilibili/summarize",
+        json={"video_url": "https://example.com/video/123"},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["request_id"] == resp.headers["X-Request-ID"]
+    assert resp.headers["X-Request-ID"]
+
+
+def test_runtime_services_are_reused_until_reload() -> None:
+    first = routes_module._get_note_library_service()
+    assert routes_module._get_note_library_service() is first
+    routes_module._reload_runtime_services()
+    assert routes_module._get_note_library_service() is not first
+
+
+def test_xiaohongshu_probe_url_is_cached_until_reload(monkeypatch) -> None:
+    settings = get_settings().model_copy(deep=True)
+    settings.xiaohongshu.web_readonly.request_url = "https://Edith.Xiaohongshu.com/api/x"
+    monkeypatch.setattr(routes_module, "get_settings", lambda: settings)
+    routes_module._reload_runtime_services()
+
+    probe_url = "https://edith.xiaohongshu.com/api/sns/web/v2/user/me"
+    assert routes_module._get_xiaohongshu_probe_url() == probe_url
+    settings.xiaohongshu.web_readonly.request_url = ""
+    assert routes_module._get_xiaohongshu_probe_url() == probe_url
+    routes_module._reload_runtime_services()
+    assert routes_module._get_xiaohongshu_probe_url() == ""
+
+
+def test_xiaohongshu_probe_uses_lifespan_client(monkeypatch) -> None:
+    seen_hosts: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_hosts.append(request.url.host)
+        assert request.headers["Cookie"] == "a=1"
+        assert "Origin" not in request.headers
+        return httpx.Response(200, json={"data": {"user_id": "u-1", "guest": False}})
+
+    monkeypatch.setattr(
+        routes_module,
+        "_get_xiaohongshu_probe_url",
+        lambda: "https://edith.xiaohongshu.com/api/sns/web/v2/user/me",
+    )
+
+    async def _probe_twice():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as probe_client:
+            results = []
+            for _ in range(2):
+                results.append(
+                    await routes_module._probe_xiaohongshu_web_identity(
+                        client=probe_client,
+                        cookie="a=1",
+                        user_agent="ua",
+                        origin="",
+                        referer="",
+                    )
+                )
+            return results
+
+    assert asyncio.run(_probe_twice()) == [("u-1", False), ("u-1", False)]
+    assert seen_hosts == ["edith.xiaohongshu.com", "edith.xiaohongshu.com"]
+
+    with TestClient(app):
+        probe_client = app.state.xiaohongshu_probe_client
+        assert isinstance(probe_client, httpx.AsyncClient)
+        assert not probe_client.is_closed
+    assert probe_client.is_closed
+
+
 def test_finance_signals_ok(monkeypatch) -> None:
     class _FakeFinanceSignalsService:
         def get_dashboard_state(self) -> FinanceSignalsData:
@@ -285,7 +359,7 @@ def test_async_job_endpoints(monkeypatch) -> None:
                 ],
             )
 
-        async def get_job(self, job_id: str) -> AsyncJobStatusData:
+        def peek_job(self, job_id: str) -> AsyncJobStatusData:
             assert job_id == "job-bili-1"
             return AsyncJobStatusData(
                 job_id=job_id,
@@ -356,6 +430,25 @@ def test_async_job_endpoints(monkeypatch) -> None:
     assert retried.json()["data"]["retry_of_job_id"] == "job-bili-1"
 
 
+def test_async_job_status_not_found(monkeypatch) -> None:
+    class _FakeAsyncJobService:
+        def peek_job(self, job_id: str) -> AsyncJobStatusData | None:
+            return None
+
+    monkeypatch.setattr(app.state, "async_job_service", _FakeAsyncJobService(), raising=False)
+
+    resp = client.get('/api/jobs/job-"x"', headers={"X-Request-ID": "req-404"})
+    assert resp.status_code == 404
+    body = resp.json()
+    assert body == {
+        "ok": False,
+        "code": "JOB_NOT_FOUND",
+        "message": '未找到 job_id=job-"x" 对应的任务。',
+        "data": None,
+        "request_id": "req-404",
+    }
+
+
 def test_search_notes_endpoint(monkeypatch) -> None:
     class _FakeNoteLibraryService:
         def search_notes(
@@ -658,6 +751,24 @@ def test_bilibili_invalid_url() -> None:
     assert body["code"] == "INVALID_INPUT"
 
 
+def test_error_response_is_orjson_encoded() -> None:
+    resp = client.post(
+        "/api/bilibili/summarize",
+        json={"video_url": "https://example.com/video/123"},
+    )
+    assert resp.headers["content-type"] == "application/json"
+    # orjson keeps non-ASCII text as raw UTF-8 and emits compact separators.
+    assert resp.json()["message"] in resp.content.decode("utf-8")
+    assert b'"ok":false' in resp.content
+
+
+def test_routes_skip_response_model_validation() -> None:
+    # Handlers return ready-made responses; a response_model would re-validate
+    # every envelope through Pydantic before encoding.
+    for route in routes_module.router.routes:
+        assert route.response_model is None, route.path
+
+
 def test_xiaohongshu_summarize_single_url() -> None:
     _reset_xiaohongshu_state()
 
@@ -716,6 +827,41 @@ def test_bilibili_saved_notes_crud() -> None:
     assert listed_after.json()["data"]["total"] == 0
 
 
+def test_bilibili_saved_notes_keyset_pagination() -> None:
+    _reset_xiaohongshu_state()
+    for index in range(3):
+        saved = client.post(
+            "/api/notes/bilibili/save",
+            json={
+                "video_url": f"https://www.bilibili.com/video/BV1xx411c7m{index}",
+                "summary_markdown": f"# 总结 {index}",
+                "elapsed_ms": 1,
+                "transcript_chars": 1,
+                "title": f"分页笔记 {index}",
+            },
+        )
+        assert saved.status_code == 200
+
+    listed = client.get("/api/notes/bilibili").json()["data"]
+    all_ids = [item["note_id"] for item in listed["items"]]
+    assert len(all_ids) == 3
+
+    first_page = client.get("/api/notes/bilibili", params={"limit": 2}).json()["data"]
+    assert [item["note_id"] for item in first_page["items"]] == all_ids[:2]
+    assert first_page["next_cursor"] == all_ids[1]
+
+    second_page = client.get(
+        "/api/notes/bilibili",
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    ).json()["data"]
+    assert [item["note_id"] for item in second_page["items"]] == all_ids[2:]
+    assert second_page["next_cursor"] == ""
+
+    stale = client.get("/api/notes/bilibili", params={"limit": 2, "cursor": "missing"})
+    assert stale.status_code == 400
+    assert stale.json()["code"] == "INVALID_INPUT"
+
+
 def test_xiaohongshu_saved_notes_crud_and_dedupe_independent() -> None:
     _reset_xiaohongshu_state()
 
@@ -1028,7 +1174,7 @@ def test_existing_merge_note_format_is_refreshed_for_legacy_markdown() -> None:
     )
     assert updated_count == 1
 
-    routes_module._get_note_library_service.cache_clear()
+    routes_module._reload_runtime_services()
 
     list_resp = client.get("/api/notes/bilibili")
     assert list_resp.status_code == 200
@@ -1126,7 +1272,7 @@ def test_legacy_merge_history_without_titles_is_rehydrated_from_markdown_links()
         == 1
     )
 
-    routes_module._get_note_library_service.cache_clear()
+    routes_module._reload_runtime_services()
 
     list_resp = client.get("/api/notes/bilibili")
     assert list_resp.status_code == 200
@@ -1263,7 +1409,7 @@ def test_existing_merge_history_with_duplicate_source_refs_is_collapsed_on_refre
         == 1
     )
 
-    routes_module._get_note_library_service.cache_clear()
+    routes_module._reload_runtime_services()
 
     list_resp = client.get("/api/notes/bilibili")
     assert list_resp.status_code == 200
@@ -1687,7 +1833,12 @@ def test_xiaohongshu_auth_update_from_client() -> None:
         assert body["ok"] is True
         assert body["data"]["cookie_pairs"] == 3
         assert body["data"]["non_empty_keys"] == 4
-        assert "XHS_HEADER_COOKIE" in body["data"]["updated_keys"]
+        assert body["data"]["updated_keys"] == [
+            "XHS_HEADER_COOKIE",
+            "XHS_HEADER_ORIGIN",
+            "XHS_HEADER_REFERER",
+            "XHS_HEADER_USER_AGENT",
+        ]
         assert os.environ.get("XHS_HEADER_COOKIE") == "a=1; b=2; c=3"
         assert os.environ.get("XHS_HEADER_USER_AGENT") == "Mozilla/5.0 (Linux; Android 14)"
     finally:
@@ -1709,6 +1860,13 @@ def test_xiaohongshu_auth_update_from_client() -> None:
             os.environ["XHS_HEADER_REFERER"] = previous_referer
 
 
+def test_count_cookie_pairs_ignores_segments_without_value() -> None:
+    assert routes_module._count_cookie_pairs("") == 0
+    assert routes_module._count_cookie_pairs(" ; ;") == 0
+    assert routes_module._count_cookie_pairs("a=1;; b=2; flag") == 2
+    assert routes_module._count_cookie_pairs("token=a=b; c=3;") == 2
+
+
 def test_xiaohongshu_auth_update_rejects_empty_cookie() -> None:
     _reset_xiaohongshu_state()
     resp = client.post(
@@ -1811,3 +1969,21 @@ def test_editable_config_rejects_sensitive_keys(tmp_path) -> None:
         if original_config_path:
             os.environ["MIDAS_CONFIG_PATH"] = original_config_path
         _reset_xiaohongshu_state()
+
+
+def test_validation_error_does_not_echo_submitted_values() -> None:
+    resp = client.post(
+        "/api/xiaohongshu/auth/update",
+        json={"cookie": "a=1", "user_agent": "secret-" + "x" * 2000},
+    )
+    assert resp.status_code == 422
+    body = resp.json()
+    assert body["code"] == "INVALID_INPUT"
+    assert body["data"]["errors"] == [
+        {
+            "loc": ["body", "user_agent"],
+            "msg": "String should have at most 2000 characters",
+            "type": "string_too_long",
+        }
+    ]
+    assert "secret-" not in resp.text
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+import app.services.asr as asr_module
+from app.core.config import ASRConfig, Settings
+from app.services.asr import ASRService
+
+
+class _FakeSegment:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _FakeWhisperModel:
+    instances: list[_FakeWhisperModel] = []
+
+    def __init__(
+        self,
+        model_size: str,
+        *,
+        device: str,
+        compute_type: str,
+        cpu_threads: int,
+    ) -> None:
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.transcribe_kwargs: dict = {}
+        _FakeWhisperModel.instances.append(self)
+
+    def transcribe(self, audio_path: str, **kwargs):
+        self.transcribe_kwargs = kwargs
+        return iter([_FakeSegment("你好"), _FakeSegment("世界")]), None
+
+
+class _FakeBatchedPipeline:
+    calls: list[dict] = []
+
+    def __init__(self, model) -> None:
+        self.model = model
+
+    def transcribe(self, audio_path: str, **kwargs):
+        _FakeBatchedPipeline.calls.append(kwargs)
+        return iter([_FakeSegment("批量")]), None
+
+
+def test_transcribe_reuses_loaded_model_until_settings_change(tmp_path: Path, monkeypatch) -> None:
+    fake_module = types.ModuleType("faster_whisper")
+    fake_module.WhisperModel = _FakeWhisperModel
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+    monkeypatch.setattr(asr_module, "_model", None)
+    monkeypatch.setattr(asr_module, "_model_key", None)
+    _FakeWhisperModel.instances = []
+    audio_path = tmp_path / "audio.wav"
+
+    base = Settings(asr=ASRConfig(mode="faster_whisper", model_size="base"))
+    assert ASRService(base).transcribe(audio_path) == "你好世界"
+    assert ASRService(base).transcribe(audio_path) == "你好世界"
+    assert len(_FakeWhisperModel.instances) == 1
+
+    small = Settings(asr=ASRConfig(mode="faster_whisper", model_size="small"))
+    ASRService(small).transcribe(audio_path)
+    assert [model.model_size for model in _FakeWhisperModel.instances] == ["base", "small"]
+    assert _FakeWhisperModel.instances[0].compute_type == "int8"
+    assert _FakeWhisperModel.instances[0].transcribe_kwargs["vad_filter"] is True
+
+
+def test_transcribe_uses_batched_pipeline_when_batch_size_set(
+    tmp_path: Path, monkeypatch
+) -> None:
+    fake_module = types.ModuleType("faster_whisper")
+    fake_module.WhisperModel = _FakeWhisperModel
+    fake_module.BatchedInferencePipeline = _FakeBatchedPipeline
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+    monkeypatch.setattr(asr_module, "_model", None)
+    monkeypatch.setattr(asr_module, "_model_key", None)
+    _FakeBatchedPipeline.calls = []
+    audio_path = tmp_path / "audio.m4a"
+
+    settings = Settings(asr=ASRConfig(mode="faster_whisper", batch_size=8))
+    assert ASRService(settings).transcribe(audio_path) == "批量"
+    assert _FakeBatchedPipeline.calls[0]["batch_size"] == 8
+
+    # Older faster-whisper without the pipeline falls back to sequential decoding.
+    del fake_module.BatchedInferencePipeline
+    assert ASRService(settings).transcribe(audio_path) == "你好世界"
+
+
+def test_resolve_compute_type_defaults_by_device() -> None:
+    assert asr_module._resolve_compute_type("auto", "cpu") == "int8"
+    assert asr_module._resolve_compute_type("auto", "cuda") == "int8_float16"
+    assert asr_module._resolve_compute_type(" Float16 ", "cuda") == "float16"
+
+
+def test_prewarm_skips_mock_mode_and_swallows_missing_dependency(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "faster_whisper", None)
+    monkeypatch.setattr(asr_module, "_model", None)
+
+    ASRService(Settings(asr=ASRConfig(mode="mock"))).prewarm()
+    ASRService(Settings(asr=ASRConfig(mode="faster_whisper"))).prewarm()
+
+    assert asr_module._model is None
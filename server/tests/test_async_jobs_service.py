@@ -200,3 +200,88 @@ async def test_async_job_service_retries_failed_job_with_same_payload(tmp_path:
     finally:
         await service.stop()
 
+
+@pytest.mark.asyncio
+async def test_async_job_service_runs_jobs_on_configured_worker_count(tmp_path: Path) -> None:
+    settings = get_settings().model_copy(deep=True)
+    settings.runtime.temp_dir = str(tmp_path)
+    settings.runtime.async_job_workers = 2
+    running = 0
+    peak_running = 0
+
+    async def fake_bilibili_runner(video_url: str) -> BilibiliSummaryData:
+        nonlocal running, peak_running
+        running += 1
+        peak_running = max(peak_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return BilibiliSummaryData(
+            video_url=video_url,
+            summary_markdown="# done",
+            elapsed_ms=1,
+            transcript_chars=1,
+        )
+
+    async def fake_xhs_runner(url: str) -> XiaohongshuSummaryItem:
+        raise AssertionError("unexpected xiaohongshu job")
+
+    service = AsyncJobService(
+        settings,
+        bilibili_runner=fake_bilibili_runner,
+        xiaohongshu_runner=fake_xhs_runner,
+    )
+    await service.start()
+    try:
+        created = [
+            await service.create_bilibili_summary_job(
+                video_url=f"https://www.bilibili.com/video/BV1xx411c7m{index}",
+                request_id=f"req-{index}",
+            )
+            for index in range(3)
+        ]
+        for item in created:
+            assert await _wait_for_terminal_status(service, item.job_id) == "SUCCEEDED"
+        assert peak_running == 2
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_job_service_normalizes_persisted_error_records(tmp_path: Path) -> None:
+    settings = get_settings().model_copy(deep=True)
+    settings.runtime.temp_dir = str(tmp_path)
+    (tmp_path / "async_jobs.json").write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {
+                        "job_id": "job-failed",
+                        "job_type": "bilibili_summarize",
+                        "status": "FAILED",
+                        "submitted_at": "2026-03-12 12:00:00",
+                        "request_payload": {"video_url": "https://b23.tv/x"},
+                        "error": {"code": " UPSTREAM_ERROR ", "message": 42, "details": "x"},
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    async def fake_runner(_url: str) -> BilibiliSummaryData:
+        raise AssertionError("no job should run")
+
+    service = AsyncJobService(
+        settings,
+        bilibili_runner=fake_runner,
+        xiaohongshu_runner=fake_runner,
+    )
+    await service.start()
+    try:
+        status = await service.get_job("job-failed")
+        assert status.error is not None
+        assert status.error.code == "UPSTREAM_ERROR"
+        assert status.error.message == "42"
+        assert status.error.details is None
+    finally:
+        await service.stop()
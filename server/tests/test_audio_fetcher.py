@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.config import Settings
+from app.core.errors import AppError
+from app.services.audio_fetcher import AudioFetcher
+
+
+def test_find_downloaded_audio_returns_extracted_source_codec(tmp_path: Path) -> None:
+    (tmp_path / "source.opus").write_bytes(b"opus")
+    (tmp_path / "source.info.json").write_bytes(b"{}")
+
+    assert AudioFetcher(Settings())._find_downloaded_audio(tmp_path) == tmp_path / "source.opus"
+
+
+def test_find_downloaded_audio_falls_back_to_other_audio_suffix(tmp_path: Path) -> None:
+    (tmp_path / "source.M4A").write_bytes(b"m4a")
+    (tmp_path / "source.part").write_bytes(b"partial")
+
+    assert AudioFetcher(Settings())._find_downloaded_audio(tmp_path) == tmp_path / "source.M4A"
+
+
+def test_find_downloaded_audio_raises_when_nothing_matches(tmp_path: Path) -> None:
+    (tmp_path / "source.part").write_bytes(b"partial")
+
+    with pytest.raises(AppError):
+        AudioFetcher(Settings())._find_downloaded_audio(tmp_path)
+
+
+_FAKE_YT_DLP = """
+import sys
+from pathlib import Path
+template = sys.argv[sys.argv.index("-o") + 1]
+assert "--audio-format" not in sys.argv
+Path(template.replace("%(ext)s", "m4a")).write_bytes(b"m4a")
+"""
+
+
+def _use_fake_yt_dlp(fetcher: AudioFetcher, monkeypatch, script: str) -> list[str]:
+    calls: list[str] = []
+
+    def _resolve_yt_dlp() -> list[str]:
+        calls.append("yt-dlp")
+        return [sys.executable, "-c", script]
+
+    def _resolve_ffmpeg() -> str:
+        calls.append("ffmpeg")
+        return "/usr/bin/ffmpeg"
+
+    monkeypatch.setattr(fetcher, "_resolve_yt_dlp_command", _resolve_yt_dlp)
+    monkeypatch.setattr(fetcher, "_resolve_ffmpeg_location", _resolve_ffmpeg)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_fetch_audio_async_runs_subprocess_and_resolves_tools_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    fetcher = AudioFetcher(Settings())
+    calls = _use_fake_yt_dlp(fetcher, monkeypatch, _FAKE_YT_DLP)
+
+    url = "https://www.bilibili.com/video/BV1xx411c7mD"
+    first = await fetcher.fetch_audio_async(url, tmp_path / "a")
+    second = await fetcher.fetch_audio_async(url, tmp_path / "b")
+
+    assert first == tmp_path / "a" / "source.m4a"
+    assert second.read_bytes() == b"m4a"
+    assert calls == ["yt-dlp", "ffmpeg"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_audio_async_reports_stderr_tail_on_failure(
+    tmp_path: Path, monkeypatch
+) -> None:
+    fetcher = AudioFetcher(Settings())
+    _use_fake_yt_dlp(
+        fetcher,
+        monkeypatch,
+        "import sys; sys.stderr.write('x' * 200000 + 'ERROR: 404'); sys.exit(1)",
+    )
+
+    with pytest.raises(AppError) as exc_info:
+        await fetcher.fetch_audio_async("https://www.bilibili.com/video/BV1xx411c7mD", tmp_path)
+
+    assert exc_info.value.code.value == "UPSTREAM_ERROR"
+    stderr_tail = exc_info.value.details["stderr"]
+    assert len(stderr_tail) == 500
+    assert stderr_tail.endswith("ERROR: 404")
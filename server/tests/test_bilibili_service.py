@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from app.core.config import Settings
+from app.core.errors import AppError, ErrorCode
 from app.services.bilibili import BilibiliSummarizer
 from app.services.comment_insights import CommentSnippet
 from app.services.bilibili import _normalize_bilibili_video_url
@@ -26,6 +27,11 @@ def test_normalize_non_bvid_input_keeps_original_text_except_trim() -> None:
     )
 
 
+def test_normalize_bvid_rejects_non_ascii_case_folding_lookalikes() -> None:
+    kelvin_sign_id = "BV1xx411c7m\u212a"
+    assert _normalize_bilibili_video_url(kelvin_sign_id) == kelvin_sign_id
+
+
 def test_extract_bvid_from_url_and_text() -> None:
     summarizer = BilibiliSummarizer(Settings())
     assert (
@@ -35,6 +41,22 @@ def test_extract_bvid_from_url_and_text() -> None:
     assert summarizer._extract_bvid("看看这个 bv1xx411c7mD") == "BV1xx411c7mD"
 
 
+def test_validate_url_checks_scheme_and_exact_host() -> None:
+    summarizer = BilibiliSummarizer(Settings())
+    summarizer._validate_url("https://www.bilibili.com/video/BV1xx411c7mD")
+    summarizer._validate_url("HTTP://b23.tv/abc")
+
+    for url in (
+        "ftp://www.bilibili.com/video/BV1xx411c7mD",
+        "https://www.bilibili.com:8080/video/BV1xx411c7mD",
+        "https://evil.com/www.bilibili.com",
+        "www.bilibili.com/video/BV1xx411c7mD",
+    ):
+        with pytest.raises(AppError) as exc_info:
+            summarizer._validate_url(url)
+        assert exc_info.value.code == ErrorCode.INVALID_INPUT
+
+
 @pytest.mark.asyncio
 async def test_append_comment_insights_adds_weighted_section(monkeypatch) -> None:
     summarizer = BilibiliSummarizer(
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+
+import app.core.config as config_module
+from app.core.config import load_settings
+
+
+def test_load_settings_reuses_snapshot_until_file_or_env_changes(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "llm:\n  api_key: ${MIDAS_TEST_LLM_KEY}\nruntime:\n  log_level: INFO\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("MIDAS_CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("MIDAS_TEST_LLM_KEY", "key-1")
+    monkeypatch.setattr(config_module, "_settings_snapshot", None)
+
+    first = load_settings()
+    assert first.llm.api_key == "key-1"
+    assert load_settings() is first
+
+    monkeypatch.setenv("MIDAS_TEST_LLM_KEY", "key-2")
+    second = load_settings()
+    assert second is not first
+    assert second.llm.api_key == "key-2"
+
+    config_path.write_text(
+        "llm:\n  api_key: ${MIDAS_TEST_LLM_KEY}\nruntime:\n  log_level: DEBUG\n",
+        encoding="utf-8",
+    )
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = load_settings()
+    assert third is not second
+    assert third.runtime.log_level == "DEBUG"
+
+
+def test_expand_env_vars_only_copies_containers_with_substitutions(monkeypatch) -> None:
+    monkeypatch.setenv("MIDAS_TEST_TOKEN", "abc")
+    untouched = {"host": "0.0.0.0", "tags": ["a", "b"]}
+    payload = {"server": untouched, "auth": {"access_token": "${MIDAS_TEST_TOKEN}"}}
+
+    expanded = config_module._expand_env_vars(payload)
+
+    assert expanded == {"server": untouched, "auth": {"access_token": "abc"}}
+    assert expanded is not payload
+    assert expanded["server"] is untouched
+    assert payload["auth"]["access_token"] == "${MIDAS_TEST_TOKEN}"
+    assert config_module._expand_env_vars(untouched) is untouched
+
+
+def test_load_dotenv_skips_unchanged_file(tmp_path, monkeypatch) -> None:
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("MIDAS_TEST_DOTENV_A=1\n", encoding="utf-8")
+    monkeypatch.setattr(config_module, "_dotenv_loaded_key", None)
+    monkeypatch.delenv("MIDAS_TEST_DOTENV_A", raising=False)
+    monkeypatch.delenv("MIDAS_TEST_DOTENV_B", raising=False)
+
+    config_module._load_dotenv(tmp_path)
+    assert os.environ["MIDAS_TEST_DOTENV_A"] == "1"
+
+    monkeypatch.delenv("MIDAS_TEST_DOTENV_A")
+    config_module._load_dotenv(tmp_path)
+    assert "MIDAS_TEST_DOTENV_A" not in os.environ
+
+    dotenv_path.write_text(
+        "MIDAS_TEST_DOTENV_A=1\nexport MIDAS_TEST_DOTENV_B='two'\n",
+        encoding="utf-8",
+    )
+    config_module._load_dotenv(tmp_path)
+    assert os.environ["MIDAS_TEST_DOTENV_A"] == "1"
+    assert os.environ["MIDAS_TEST_DOTENV_B"] == "two"
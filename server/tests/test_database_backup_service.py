@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 from pathlib import Path
 
 from app.core.config import RuntimeConfig, Settings, XiaohongshuConfig
@@ -49,6 +50,12 @@ def test_periodic_backup_run_once_creates_backup(tmp_path: Path) -> None:
     assert backup_path.exists()
     latest_backup = db_path.parent / "backups" / "midas_latest.db"
     assert latest_backup.exists()
+    with sqlite3.connect(str(db_path)) as conn:
+        stat_tables = {
+            row[0]
+            for row in conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+        }
+    assert "saved_bilibili_notes" in stat_tables
 
 
 def test_periodic_backup_run_stops_cleanly(tmp_path: Path) -> None:
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from app.core.config import clear_settings_cache
+import pytest
+
+import app.services.editable_config as editable_config_module
+from app.core.config import Settings, clear_settings_cache
+from app.core.errors import AppError, ErrorCode
 from app.services.editable_config import EditableConfigService
 
 
@@ -26,3 +30,100 @@ def test_update_editable_config_atomic_write_and_cleanup(tmp_path, monkeypatch)
         if path.name.startswith(f".{config_path.name}.") and path.name.endswith(".tmp")
     ]
     assert leftovers == []
+
+
+def test_load_yaml_reuses_parse_until_file_changes(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("runtime:\n  log_level: INFO\n", encoding="utf-8")
+    service = EditableConfigService(config_path=config_path, default_path=config_path)
+
+    calls = []
+    real_load = editable_config_module.yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(1)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(editable_config_module.yaml, "load", counting_load)
+
+    first = service._load_yaml(config_path)
+    first["runtime"]["log_level"] = "MUTATED"
+    assert service._load_yaml(config_path) == {"runtime": {"log_level": "INFO"}}
+    assert len(calls) == 1
+
+    config_path.write_text("runtime:\n  log_level: WARNING\n", encoding="utf-8")
+    assert service._load_yaml(config_path) == {"runtime": {"log_level": "WARNING"}}
+    assert len(calls) == 2
+
+
+def test_flatten_patch_keeps_depth_first_key_order(tmp_path) -> None:
+    service = EditableConfigService(config_path=tmp_path / "config.yaml")
+
+    flattened = service._flatten_patch(
+        {
+            "asr": {"mode": "mock"},
+            "xiaohongshu": {"web_readonly": {"items_path": "a"}, "mode": "web_readonly"},
+            "": 1,
+        }
+    )
+
+    assert list(flattened.items()) == [
+        ("asr.mode", "mock"),
+        ("xiaohongshu.web_readonly.items_path", "a"),
+        ("xiaohongshu.mode", "web_readonly"),
+    ]
+
+
+def test_update_rejects_first_non_editable_path(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("runtime:\n  log_level: INFO\n", encoding="utf-8")
+    service = EditableConfigService(config_path=config_path, default_path=config_path)
+
+    with pytest.raises(AppError) as exc_info:
+        service.update_editable_settings(
+            {"runtime": {"log_level": "DEBUG"}, "llm": {"api_key": "secret"}}
+        )
+
+    assert exc_info.value.code == ErrorCode.INVALID_INPUT
+    assert exc_info.value.message == "字段不可修改或不存在：llm.api_key"
+    assert config_path.read_text(encoding="utf-8") == "runtime:\n  log_level: INFO\n"
+
+
+def test_reset_to_defaults_skips_write_when_already_default(tmp_path, monkeypatch) -> None:
+    source = Path(__file__).resolve().parent / "config.test.yaml"
+    config_path = tmp_path / "config.yaml"
+    default_path = tmp_path / "config.example.yaml"
+    config_path.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+    default_path.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setenv("MIDAS_CONFIG_PATH", str(config_path))
+    clear_settings_cache()
+
+    service = EditableConfigService(config_path=config_path, default_path=default_path)
+    writes: list[Path] = []
+    real_write = service._write_yaml
+
+    def recording_write(path: Path, payload: dict) -> None:
+        writes.append(path)
+        real_write(path, payload)
+
+    monkeypatch.setattr(service, "_write_yaml", recording_write)
+
+    service.reset_to_defaults()
+    assert writes == []
+
+    service.update_editable_settings({"runtime": {"log_level": "DEBUG"}})
+    writes.clear()
+    result = service.reset_to_defaults()
+    assert writes == [config_path]
+    assert result["runtime"]["log_level"] == "INFO"
+
+
+def test_extract_from_settings_matches_model_dump(tmp_path) -> None:
+    service = EditableConfigService(config_path=tmp_path / "config.yaml")
+    settings = Settings()
+
+    extracted = service._extract_from_settings(settings)
+
+    assert extracted == service._extract_allowed(settings.model_dump())
+    extracted["xiaohongshu"]["web_readonly"]["host_allowlist"].append("example.com")
+    assert "example.com" not in settings.xiaohongshu.web_readonly.host_allowlist
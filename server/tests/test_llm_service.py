@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import app.services.llm as llm_module
+from app.core.config import LLMConfig, Settings
+from app.core.errors import AppError, ErrorCode
+from app.services.llm import LLMService
+
+_SETTINGS = Settings(llm=LLMConfig(enabled=True, api_key="test-key"))
+
+
+def _run_summarize(handler) -> str:
+    # Serves the LLM through a MockTransport client registered as the shared client.
+    async def _run() -> str:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            previous = llm_module.set_shared_client(client)
+            try:
+                return await LLMService(_SETTINGS).summarize("转写", "https://b23.tv/x")
+            finally:
+                llm_module.set_shared_client(previous)
+
+    return asyncio.run(_run())
+
+
+def test_llm_requests_reuse_the_lifespan_client(monkeypatch) -> None:
+    requests: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"content": "# 标题\n\n内容"}}]},
+        )
+
+    def _unexpected_client(**kwargs) -> httpx.AsyncClient:
+        raise AssertionError("per-request client should not be created")
+
+    async def _run() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as shared:
+            previous = llm_module.set_shared_client(shared)
+            monkeypatch.setattr(llm_module.httpx, "AsyncClient", _unexpected_client)
+            try:
+                return [
+                    await LLMService(_SETTINGS).summarize("转写", "https://b23.tv/x"),
+                    await LLMService(_SETTINGS).summarize("转写", "https://b23.tv/y"),
+                ]
+            finally:
+                llm_module.set_shared_client(previous)
+
+    assert asyncio.run(_run()) == ["# 标题\n\n内容", "# 标题\n\n内容"]
+    assert len(requests) == 2
+    assert llm_module._shared_client is None
+
+
+def test_llm_request_without_shared_client_closes_its_own(monkeypatch) -> None:
+    created: list[httpx.AsyncClient] = []
+    real_client_cls = httpx.AsyncClient
+
+    def _client_factory(**kwargs) -> httpx.AsyncClient:
+        client = real_client_cls(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"choices": [{"message": {"content": "ok"}}]}
+                )
+            ),
+            **kwargs,
+        )
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(llm_module.httpx, "AsyncClient", _client_factory)
+    monkeypatch.setattr(llm_module, "_shared_client", None)
+
+    assert asyncio.run(LLMService(_SETTINGS).summarize("转写", "https://b23.tv/x")) == "ok"
+    assert len(created) == 1
+    assert created[0].is_closed
+
+
+@pytest.mark.parametrize(
+    ("status", "code", "message", "http_status"),
+    [
+        (403, ErrorCode.AUTH_EXPIRED, "LLM 鉴权失败，请检查 API Key。", 401),
+        (429, ErrorCode.RATE_LIMITED, "LLM 请求触发限流，请稍后重试。", 429),
+        (503, ErrorCode.UPSTREAM_ERROR, "LLM 上游服务异常。", 502),
+        (404, ErrorCode.UPSTREAM_ERROR, "LLM 请求失败（HTTP 404）。", 502),
+    ],
+)
+def test_llm_error_status_mapping(status, code, message, http_status) -> None:
+    with pytest.raises(AppError) as exc_info:
+        _run_summarize(lambda request: httpx.Response(status))
+    assert exc_info.value.code == code
+    assert exc_info.value.message == message
+    assert exc_info.value.status_code == http_status
+
+
+def test_llm_non_json_response_maps_to_upstream_error() -> None:
+    with pytest.raises(AppError) as exc_info:
+        _run_summarize(lambda request: httpx.Response(200, content=b"<html>gateway</html>"))
+    assert exc_info.value.code == ErrorCode.UPSTREAM_ERROR
+    assert exc_info.value.status_code == 502
+
+
+def test_llm_reads_streamed_delta_text() -> None:
+    requests: list[dict] = []
+    sse_body = (
+        'data: {"choices":[{"delta":{"role":"assistant"}}]}\n\n'
+        'data: {"choices":[{"delta":{"content":"# 标题"}}]}\n\n'
+        ": keep-alive\n\n"
+        'data: {"choices":[{"delta":{"content":"\\n\\n内容"}}]}\n\n'
+        'data: {"choices":[],"usage":{"total_tokens":3}}\n\n'
+        "data: [DONE]\n\n"
+    ).encode("utf-8")
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream; charset=utf-8"},
+            content=sse_body,
+        )
+
+    assert _run_summarize(_handler) == "# 标题\n\n内容"
+    assert requests[0]["stream"] is True
+
+
+def _sse_handler(*events: str):
+    body = "".join(f"data: {event}\n\n" for event in events).encode("utf-8")
+    return lambda request: httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        content=body,
+    )
+
+
+@pytest.mark.parametrize(
+    ("events", "message"),
+    [
+        (
+            (
+                '{"choices":[{"delta":{"content":"# 标题\\n\\n前半段"}}]}',
+                '{"error":{"message":"overloaded"}}',
+            ),
+            "LLM 流式响应中途出错。",
+        ),
+        (
+            ('{"choices":[{"delta":{"content":"# 标题\\n\\n前半段"}}]}',),
+            "LLM 流式响应未完整结束。",
+        ),
+        (
+            ('{"choices":[{"delta":{"content":"# 标题"}}]}', '{"object":"chunk"}'),
+            "LLM 响应结构异常。",
+        ),
+    ],
+)
+def test_llm_broken_stream_raises_instead_of_truncating(events, message) -> None:
+    with pytest.raises(AppError) as exc_info:
+        _run_summarize(_sse_handler(*events))
+    assert exc_info.value.code == ErrorCode.UPSTREAM_ERROR
+    assert exc_info.value.message == message
+
+
+def test_llm_stream_accepts_finish_reason_without_done() -> None:
+    handler = _sse_handler(
+        '{"choices":[{"delta":{"content":"# 标题"},"finish_reason":null}]}',
+        '{"choices":[{"delta":{},"finish_reason":"stop"}]}',
+    )
+    assert _run_summarize(handler) == "# 标题"
@@ -160,6 +160,18 @@ def test_backup_database_prunes_old_timestamp_backups(tmp_path: Path) -> None:
     assert (backup_dir / "notes_latest.db").exists()
 
 
+def test_backup_database_links_latest_to_newest_backup(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+
+    repo.backup_database()
+    newest = repo.backup_database()
+
+    latest = db_path.parent / "backups" / "notes_latest.db"
+    assert latest.stat().st_ino == newest.stat().st_ino
+    assert not latest.with_name("notes_latest.db.tmp").exists()
+
+
 def test_search_notes_supports_keyword_source_limit_and_offset(tmp_path: Path) -> None:
     db_path = tmp_path / "notes.db"
     repo = NoteLibraryRepository(str(db_path))
@@ -357,3 +369,171 @@ def test_search_notes_supports_saved_from_and_merged_filter(tmp_path: Path) -> N
     assert total_merged == 1
     assert merged_items[0]["note_id"] == "merged_note_1"
     assert merged_items[0]["is_merged"] == 1
+
+
+def test_repository_opens_database_in_wal_mode(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    NoteLibraryRepository(str(db_path))
+
+    with sqlite3.connect(str(db_path)) as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+
+def test_repository_reuses_thread_connection_and_rolls_back_failures(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+    assert repo._thread_connection() is repo._thread_connection()
+
+    try:
+        with repo._connect(immediate=True) as conn:
+            conn.execute(
+                "INSERT INTO saved_xiaohongshu_notes "
+                "(note_id, title, source_url, summary_markdown) VALUES ('x1', 't', 'u', 's')"
+            )
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert repo.list_xiaohongshu_notes() == []
+    assert repo._thread_connection().in_transaction is False
+
+
+def test_listing_queries_use_indexes(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    NoteLibraryRepository(str(db_path))
+
+    with sqlite3.connect(str(db_path)) as conn:
+        bilibili_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT note_id FROM saved_bilibili_notes "
+            "ORDER BY saved_bilibili_notes.saved_at DESC, rowid DESC"
+        ).fetchall()
+        merge_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT merge_id FROM note_merge_history "
+            "WHERE source = ? ORDER BY created_at DESC, rowid DESC",
+            ("bilibili",),
+        ).fetchall()
+
+    assert "USING INDEX idx_bili_saved_at" in " ".join(str(row[-1]) for row in bilibili_plan)
+    assert "idx_merge_source_ts" in " ".join(str(row[-1]) for row in merge_plan)
+    assert "TEMP B-TREE" not in " ".join(str(row[-1]) for row in merge_plan)
+
+
+def test_list_xiaohongshu_notes_pages_by_saved_at_cursor(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+    repo.save_xiaohongshu_notes(
+        [
+            {
+                "note_id": note_id,
+                "title": note_id,
+                "source_url": f"https://www.xiaohongshu.com/explore/{note_id}",
+                "summary_markdown": "# 测试",
+            }
+            for note_id in ("x1", "x2", "x3")
+        ]
+    )
+    for note_id, saved_at in (
+        ("x1", "2026-03-01 00:00:00"),
+        ("x2", "2026-03-03 00:00:00"),
+        ("x3", "2026-03-02 00:00:00"),
+    ):
+        _update_saved_at(
+            db_path=db_path,
+            table="saved_xiaohongshu_notes",
+            note_id=note_id,
+            saved_at=saved_at,
+        )
+
+    first_page = repo.list_xiaohongshu_notes(limit=2)
+    assert [item["note_id"] for item in first_page] == ["x2", "x3"]
+    next_page = repo.list_xiaohongshu_notes(limit=2, after_note_id="x3")
+    assert [item["note_id"] for item in next_page] == ["x1"]
+    assert [item["note_id"] for item in repo.list_xiaohongshu_notes()] == ["x2", "x3", "x1"]
+
+
+def test_bulk_note_id_lookups_accept_more_ids_than_sqlite_variable_limit(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+    repo.save_xiaohongshu_notes(
+        [
+            {
+                "note_id": f"x{index}",
+                "title": "测试",
+                "source_url": f"https://www.xiaohongshu.com/explore/x{index}",
+                "summary_markdown": "# 测试",
+            }
+            for index in range(1200)
+        ]
+    )
+    note_ids = [f"x{index}" for index in range(1200)] + ["missing"]
+
+    assert len(repo.get_xiaohongshu_notes_by_ids(note_ids)) == 1200
+    assert repo.delete_xiaohongshu_notes(note_ids) == 1200
+    assert repo.list_xiaohongshu_notes() == []
+
+
+def test_save_xiaohongshu_notes_counts_only_new_or_changed_notes(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+    notes = [
+        {
+            "note_id": note_id,
+            "title": "测试",
+            "source_url": f"https://www.xiaohongshu.com/explore/{note_id}",
+            "summary_markdown": "# 测试",
+        }
+        for note_id in ("x1", "x2")
+    ]
+
+    assert repo.save_xiaohongshu_notes(notes) == 2
+    assert repo.save_xiaohongshu_notes(notes) == 0
+
+    notes[1] = {**notes[1], "summary_markdown": "# 更新"}
+    assert repo.save_xiaohongshu_notes(notes) == 1
+    saved = {item["note_id"]: item for item in repo.list_xiaohongshu_notes()}
+    assert saved["x2"]["summary_markdown"] == "# 更新"
+
+
+def test_init_tables_runs_schema_ddl_once_per_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    NoteLibraryRepository(str(db_path))
+    with sqlite3.connect(str(db_path)) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+        conn.execute("DROP INDEX idx_bili_saved_at")
+
+    NoteLibraryRepository(str(db_path))
+
+    with sqlite3.connect(str(db_path)) as conn:
+        index_names = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+    assert "idx_bili_saved_at" not in index_names
+
+
+def test_write_batch_commits_or_rolls_back_nested_writes_together(tmp_path: Path) -> None:
+    db_path = tmp_path / "notes.db"
+    repo = NoteLibraryRepository(str(db_path))
+    note = {
+        "note_id": "x1",
+        "title": "测试",
+        "source_url": "https://www.xiaohongshu.com/explore/x1",
+        "summary_markdown": "# 测试",
+    }
+
+    try:
+        with repo.write_batch():
+            repo.save_xiaohongshu_notes([note])
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert repo.list_xiaohongshu_notes() == []
+
+    with repo.write_batch():
+        repo.save_xiaohongshu_notes([note])
+        repo.upsert_source_index_links(
+            platform="xiaohongshu",
+            mappings={"x1": {"canonical_note_id": "x1", "merge_id": "", "state": "ACTIVE"}},
+        )
+    assert [item["note_id"] for item in repo.list_xiaohongshu_notes()] == ["x1"]
+    assert repo._thread_connection().in_transaction is False
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+
+
+def _build_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"pong": True}
+
+    return TestClient(app)
+
+
+def test_profiling_middleware_passes_through_without_flag() -> None:
+    resp = _build_client().get("/ping")
+    assert resp.status_code == 200
+    assert resp.json() == {"pong": True}
+
+
+def test_profiling_middleware_reports_missing_dependency(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "pyinstrument", None)
+    resp = _build_client().get("/ping", params={"profile": "1"})
+    assert resp.status_code == 500
+    body = resp.json()
+    assert body["code"] == "DEPENDENCY_MISSING"
+    assert body["request_id"] == resp.headers["X-Request-ID"]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+
+from app.core.response import ORJSONResponse, success_body, success_response
+from app.models.schemas import HealthData
+
+
+def test_orjson_response_handles_non_native_values() -> None:
+    response = ORJSONResponse(
+        {
+            1: HealthData(),
+            "path": Path("/tmp/midas.db"),
+            "amount": Decimal("1.5"),
+            "error": ValueError("bad value"),
+        }
+    )
+    assert orjson.loads(response.body) == {
+        "1": {"status": "ok"},
+        "path": "/tmp/midas.db",
+        "amount": 1.5,
+        "error": "bad value",
+    }
+
+
+def test_success_body_matches_envelope_shape() -> None:
+    data = HealthData(status="ok")
+    body = success_body(data, 'req-"1"')
+    assert orjson.loads(body) == success_response(
+        data=data.model_dump(), request_id='req-"1"'
+    )
@@ -164,6 +164,18 @@ def test_apply_capture_to_config() -> None:
     assert merged["xiaohongshu"]["web_readonly"]["items_path"] == "data.notes"
 
 
+def test_request_capture_exposes_host_and_headers_count() -> None:
+    capture = RequestCapture(
+        request_url="https://edith.xiaohongshu.com/api/sns/web/v2/note/collect/page?num=30",
+        request_method="GET",
+        request_headers={"cookie": "a=b", "user-agent": "UA"},
+        request_body="",
+    )
+
+    assert capture.request_host == "edith.xiaohongshu.com"
+    assert capture.headers_count == 2
+
+
 def test_build_env_updates_from_capture_case_insensitive_headers() -> None:
     capture = RequestCapture(
         request_url="https://edith.xiaohongshu.com/api/sns/web/v2/note/collect/page?num=30",
@@ -200,7 +200,7 @@ async def test_summarize_url_video_note_uses_audio_asr_and_video_llm(tmp_path: P
         def __init__(self) -> None:
             self.last_headers: dict[str, str] | None = None
 
-        def fetch_audio(self, video_url: str, output_dir: Path, headers=None):
+        async def fetch_audio_async(self, video_url: str, output_dir: Path, headers=None):
             _ = video_url
             self.last_headers = headers
             audio_path = output_dir / "source.wav"
@@ -208,6 +208,9 @@ async def test_summarize_url_video_note_uses_audio_asr_and_video_llm(tmp_path: P
             return audio_path
 
     class DummyASR:
+        def prewarm(self) -> None:
+            return None
+
         def transcribe(self, audio_path: Path) -> str:
             assert audio_path.name == "source.wav"
             return "这是视频转写文本。"
@@ -248,7 +251,7 @@ async def test_summarize_url_video_note_falls_back_to_text_summary_when_asr_fail
     settings = _make_web_settings(tmp_path)
 
     class BrokenFetcher:
-        def fetch_audio(self, video_url: str, output_dir: Path, headers=None):
+        async def fetch_audio_async(self, video_url: str, output_dir: Path, headers=None):
             raise AppError(
                 code=ErrorCode.UPSTREAM_ERROR,
                 message="音频下载失败",
@@ -979,3 +982,30 @@ async def test_fetch_comment_snippets_uses_initial_state_without_comment_api(
     assert len(comments) == 1
     assert comments[0].text == "首包评论"
     assert comments[0].like_count == 9
+
+
+def test_sync_repository_reuses_thread_connection(tmp_path: Path) -> None:
+    repo = XiaohongshuSyncRepository(str(tmp_path / "midas.db"))
+
+    repo.mark_synced("n1", "title", "https://www.xiaohongshu.com/explore/n1")
+    repo.set_state("cursor", "abc")
+
+    assert repo._thread_connection() is repo._thread_connection()
+    assert repo._thread_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert repo.is_synced("n1") is True
+    assert repo.get_state("cursor") == "abc"
+    assert repo._thread_connection().in_transaction is False
+
+
+def test_sync_repository_is_synced_checks_synced_table_and_source_index(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "midas.db")
+    repo = XiaohongshuSyncRepository(db_path)
+    NoteLibraryRepository(db_path).upsert_source_index_links(
+        platform="xiaohongshu",
+        mappings={"linked": {"canonical_note_id": "merged", "merge_id": "m1", "state": "ACTIVE"}},
+    )
+    repo.mark_synced("synced", "title", "https://www.xiaohongshu.com/explore/synced")
+
+    assert repo.is_synced("synced") is True
+    assert repo.is_synced("linked") is True
+    assert repo.is_synced("missing") is False
@@ -79,7 +79,7 @@ fi
 removed=0
 while IFS= read -r -d '' path; do
   name="$(basename "$path")"
-  if [[ "$KEEP_DB" == "1" && "$name" == "midas.db" ]]; then
+  if [[ "$KEEP_DB" == "1" && ( "$name" == "midas.db" || "$name" == "midas.db-wal" || "$name" == "midas.db-shm" ) ]]; then
     continue
   fi
 
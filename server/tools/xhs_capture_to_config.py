@@ -7,6 +7,7 @@ import re
 import shlex
 import sys
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -52,6 +53,14 @@ class RequestCapture:
     request_body: str
     inference: FieldInference | None = None
 
+    @cached_property
+    def request_host(self) -> str:
+        return urlparse(self.request_url).netloc
+
+    @property
+    def headers_count(self) -> int:
+        return len(self.request_headers)
+
 
 def parse_curl_text(curl_text: str) -> RequestCapture:
     normalized = _normalize_curl_text(curl_text)
@@ -804,9 +813,9 @@ def _print_summary(
 ) -> None:
     action = "预览将更新" if dry_run else "已更新"
     print(f"[xhs_capture_to_config] {action} .env 变量。")
-    print(f"- request_url_host: {urlparse(capture.request_url).netloc}")
+    print(f"- request_url_host: {capture.request_host}")
     print(f"- request_method: {capture.request_method}")
-    print(f"- headers: {len(capture.request_headers)} keys")
+    print(f"- headers: {capture.headers_count} keys")
     if capture.inference is not None:
         print(f"- items_path: {capture.inference.items_path}")
         print(f"- note_id_field: {capture.inference.note_id_field}")